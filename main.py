@@ -4,12 +4,41 @@ import subprocess
 import json  # Import json for JSON operations
 import sqlite3
 import re
-import pycountry
-from PyQt5.QtCore import Qt, pyqtSignal, QObject, QThread, QTimer, QPoint, QEvent  # Added QEvent
+import math
+import glob
+import hashlib
+import threading
+import functools
+import bisect
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    # Optional in-process probe via libmediainfo; avoids a process launch per file
+    from pymediainfo import MediaInfo as _PyMediaInfo
+except ImportError:
+    _PyMediaInfo = None
+
+try:
+    # Optional Rust-accelerated JSON parser; several times faster on MediaInfo
+    # documents and ingests the subprocess bytes directly without a decode hop
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    # Optional; collapses the info-panel reductions over large selections into
+    # C-level array sums instead of interpreted per-file loops
+    import numpy as np
+except ImportError:
+    np = None
+from PyQt5.QtCore import Qt, pyqtSignal, QObject, QThread, QThreadPool, QRunnable, QTimer, QEvent  # Added QEvent
 from PyQt5.QtGui import QFont, QIcon, QCursor
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-    QTreeWidget, QTreeWidgetItem, QLabel, QLineEdit, QComboBox, QTextEdit,
+    QTreeWidget, QTreeWidgetItem, QLabel, QLineEdit, QComboBox, QPlainTextEdit,
     QMessageBox, QSizePolicy, QFileDialog, QAbstractItemView, QProgressBar,
     QCheckBox, QSplitter, QMenu, QAction, QDialog, QDialogButtonBox, QListWidget,
     QListWidgetItem, QGridLayout, QToolTip, QSpacerItem  # QToolTip already imported
@@ -95,95 +124,518 @@ DEFAULT_COL_WIDTHS = {
 # Global variable for per-file output prints
 PER_FILE_OUTPUT_ONLY = True  # Set to True to clear progress and output before each file
 
+# Unit-conversion constants for the bitrate math
+BITS_PER_MB = 8 * 1024 * 1024
+INV_MB = 1.0 / (1024 * 1024)
+
 # Increased font size for better visibility
 FONT_SIZE_INFO_PANEL = 8.1
 
+# Static ISO 639-1/639-2 table for the codes MediaInfo/HandBrake actually emit.
+# Resolving through this dict is a plain hash lookup; pycountry is only
+# consulted for codes missing here.
+_ISO639 = {
+    'ar': 'Arabic', 'ara': 'Arabic',
+    'bg': 'Bulgarian', 'bul': 'Bulgarian',
+    'bn': 'Bengali', 'ben': 'Bengali',
+    'cs': 'Czech', 'ces': 'Czech', 'cze': 'Czech',
+    'da': 'Danish', 'dan': 'Danish',
+    'de': 'German', 'deu': 'German', 'ger': 'German',
+    'el': 'Modern Greek (1453-)', 'ell': 'Modern Greek (1453-)', 'gre': 'Modern Greek (1453-)',
+    'en': 'English', 'eng': 'English',
+    'es': 'Spanish', 'spa': 'Spanish',
+    'et': 'Estonian', 'est': 'Estonian',
+    'fa': 'Persian', 'fas': 'Persian', 'per': 'Persian',
+    'fi': 'Finnish', 'fin': 'Finnish',
+    'fr': 'French', 'fra': 'French', 'fre': 'French',
+    'he': 'Hebrew', 'heb': 'Hebrew',
+    'hi': 'Hindi', 'hin': 'Hindi',
+    'hr': 'Croatian', 'hrv': 'Croatian',
+    'hu': 'Hungarian', 'hun': 'Hungarian',
+    'id': 'Indonesian', 'ind': 'Indonesian',
+    'it': 'Italian', 'ita': 'Italian',
+    'ja': 'Japanese', 'jpn': 'Japanese',
+    'ko': 'Korean', 'kor': 'Korean',
+    'lt': 'Lithuanian', 'lit': 'Lithuanian',
+    'lv': 'Latvian', 'lav': 'Latvian',
+    'ms': 'Malay (macrolanguage)', 'msa': 'Malay (macrolanguage)', 'may': 'Malay (macrolanguage)',
+    'nb': 'Norwegian Bokmål', 'nob': 'Norwegian Bokmål',
+    'nl': 'Dutch', 'nld': 'Dutch', 'dut': 'Dutch',
+    'no': 'Norwegian', 'nor': 'Norwegian',
+    'pl': 'Polish', 'pol': 'Polish',
+    'pt': 'Portuguese', 'por': 'Portuguese',
+    'ro': 'Romanian', 'ron': 'Romanian', 'rum': 'Romanian',
+    'ru': 'Russian', 'rus': 'Russian',
+    'sk': 'Slovak', 'slk': 'Slovak', 'slo': 'Slovak',
+    'sl': 'Slovenian', 'slv': 'Slovenian',
+    'sr': 'Serbian', 'srp': 'Serbian',
+    'sv': 'Swedish', 'swe': 'Swedish',
+    'ta': 'Tamil', 'tam': 'Tamil',
+    'te': 'Telugu', 'tel': 'Telugu',
+    'th': 'Thai', 'tha': 'Thai',
+    'tr': 'Turkish', 'tur': 'Turkish',
+    'uk': 'Ukrainian', 'ukr': 'Ukrainian',
+    'vi': 'Vietnamese', 'vie': 'Vietnamese',
+    'zh': 'Chinese', 'zho': 'Chinese', 'chi': 'Chinese',
+    'und': 'Undetermined',
+    'mul': 'Multiple languages',
+    'zxx': 'No linguistic content',
+}
+
+# Built lazily by _lang_maps; importing pycountry parses its full ISO database
+_pycountry_maps = None
+
+def _lang_maps():
+    """
+    Flatten pycountry's language database into one lowercase-keyed dict
+    (alpha-2 codes, alpha-3 codes, bibliographic codes and full names).
+    Built once on the first code the static _ISO639 table cannot resolve;
+    afterwards every fallback lookup is a single dict hit instead of a
+    pycountry index walk or a LookupError-raising lookup() call.
+    """
+    global _pycountry_maps
+    if _pycountry_maps is None:
+        import pycountry
+        maps = {}
+        for language in pycountry.languages:
+            if hasattr(language, 'alpha_2'):
+                maps[language.alpha_2.lower()] = language.name
+            maps[language.alpha_3.lower()] = language.name
+            if hasattr(language, 'bibliographic'):
+                maps[language.bibliographic.lower()] = language.name
+            maps[language.name.lower()] = language.name
+        _pycountry_maps = maps
+    return _pycountry_maps
+
+@functools.lru_cache(maxsize=None)
+def _resolve_lang(lang):
+    """
+    Resolve a single language code or name to its full language name.
+    Common codes resolve through the static _ISO639 table; the flattened
+    pycountry map covers the rest, and results are memoized so the same
+    handful of codes repeated across a whole library cost one lookup each.
+    """
+    full_name = _ISO639.get(lang.lower())
+    if full_name is not None:
+        return full_name
+    return _lang_maps().get(lang.lower(), lang)  # Fall back to the original string
+
+# Containers accepted into the media list
+_MEDIA_EXTS = frozenset({'.mp4', '.mkv', '.avi', '.mov'})
+
+# Keeps short-lived helper spawns (MediaInfo, ffprobe, mkvpropedit, ffmpeg)
+# from flashing a console window on Windows; a no-op elsewhere
+_NO_WINDOW = subprocess.CREATE_NO_WINDOW if sys.platform.startswith('win') else 0
+
+# BitRate values MediaInfo emits that mean "no usable number"; a frozenset
+# membership test avoids the per-track str()/lower() allocations
+_NA_SENTINELS = frozenset({'n/a', 'N/A', 'na', 'NA', '', 'None'})
+
+# Audio encoder selections for which no bitrate input applies
+_NO_AUDIO_BITRATE = frozenset({'copy', 'None'})
+
+# One-shot validation of the comma-separated positive-integer bitrate list
+_BITRATES_RE = re.compile(r'^\s*[1-9]\d*\s*(,\s*[1-9]\d*\s*)*$')
+
+# Translation table for the '.'-as-thousands-separator bitrate display
+_THOUSANDS_DOT = str.maketrans(',', '.')
+
+@functools.lru_cache(maxsize=1024)
+def _format_bitrate_str(kbps):
+    # Format with ',' as thousands separator, then swap in '.'
+    return f"{kbps:,}".translate(_THOUSANDS_DOT)
+
+def _format_bitrate_kbps(value):
+    # The same bitrates recur across files and tracks; round to an int key
+    # so the formatted string is built once per distinct value
+    return _format_bitrate_str(round(value))
+
+@functools.lru_cache(maxsize=512)
+def _format_bitrate(raw):
+    # Audio-track BitRate display keyed on the raw MediaInfo value: a media
+    # library draws from a small set of distinct bitrates, so the parse and
+    # format run once per value
+    if raw and isinstance(raw, (int, float, str)) and str(raw).lower() != "n/a":
+        try:
+            kbps = int(float(raw) / 1000)
+            if kbps > 0:
+                return f"{kbps} kbps"
+        except ValueError:
+            pass
+    return "Unknown Bitrate"
+
+@functools.lru_cache(maxsize=16)
+def _font(size, bold=False):
+    # Shared QFont per (size, bold); initUI applies the same handful of
+    # sizes to many widgets, so build each variant once
+    font = QFont()
+    font.setPointSizeF(size)
+    font.setBold(bold)
+    return font
+
+@functools.lru_cache(maxsize=512)
 def get_full_language_name(language_str):
     """
     Converts language codes to their full language names using pycountry.
     If the language_str is already a full name or unknown, it returns it as is.
+    Memoized: the same language strings recur across every track of a batch.
     """
-    # Split multiple languages if present (e.g., 'en,fr')
-    languages = [lang.strip() for lang in language_str.split(',')]
-    full_languages = []
-    for lang in languages:
-        if not lang:
-            continue  # Skip empty strings
-        # Attempt to get the language by alpha_2 code
-        language = pycountry.languages.get(alpha_2=lang.lower())
-        if language:
-            full_name = language.name
-        else:
-            # Attempt to get the language by alpha_3 code
-            language = pycountry.languages.get(alpha_3=lang.lower())
-            if language:
-                full_name = language.name
-            else:
-                # Attempt to get the language by name
-                try:
-                    language = pycountry.languages.lookup(lang)
-                    full_name = language.name
-                except LookupError:
-                    full_name = lang  # Fallback to original string if not found
-        full_languages.append(full_name)
-    # Join multiple languages back into a string
-    return ', '.join(full_languages)
+    # Split multiple languages if present (e.g., 'en,fr'); skip empty strings
+    return ', '.join(_resolve_lang(lang.strip()) for lang in language_str.split(',') if lang.strip())
+
+@dataclass
+class MediaInfo:
+    """
+    Per-file metadata shown in the media list. A slots dataclass instead of
+    a dict: large batches hold thousands of these, and slotted attribute
+    access is both smaller and faster than dict lookups. __slots__ is spelled
+    out (rather than dataclass(slots=True)) to keep Python 3.8 working.
+    """
+    __slots__ = ('filename', 'duration', 'duration_seconds', 'video',
+                 'video_info', 'audio', 'size', 'size_bytes',
+                 'total_audio_bitrate_kbps', 'path', 'audio_tracks')
+
+    filename: str
+    duration: str
+    duration_seconds: Optional[float]
+    video: str
+    video_info: str
+    audio: str
+    size: str
+    size_bytes: int
+    total_audio_bitrate_kbps: float
+    path: str
+    audio_tracks: list
 
 class WorkerSignals(QObject):
     progress = pyqtSignal(str)
     finished = pyqtSignal()
 
-class CheckMediaWorker(QThread):
+class MediaInfoProber:
+    """
+    Mixin providing a cached MediaInfo probe for the worker threads.
+    MediaInfo is only launched once per (path, mtime, size); subsequent
+    duration/bitrate/track lookups for the same file are plain dict reads.
+    """
+
+    # Maximum number of paths passed to a single MediaInfo invocation
+    # (keeps the command line well under the Windows argv length limit)
+    PROBE_BATCH_SIZE = 50
+
+    # Set by the GUI to enable the persistent on-disk probe cache
+    mi_cache_db_path = None
+
+    # Optional ffprobe binary for fast scalar duration reads
+    ffprobe_exe = None
+
+    # Serializes lazy cache setup; pooled probe threads can race into
+    # _mi_cache_conn before any connection exists
+    _mi_cache_init_lock = threading.Lock()
+
+    def _mi_cache_conn(self):
+        """
+        Lazily open the SQLite connection backing the persistent probe cache.
+        Returns None when no cache database has been configured.
+        """
+        conn = getattr(self, '_mi_cache_db', None)
+        if conn is None:
+            if not self.mi_cache_db_path:
+                return None
+            with self._mi_cache_init_lock:
+                # Re-check under the lock: another thread may have finished
+                # the setup while this one waited
+                conn = getattr(self, '_mi_cache_db', None)
+                if conn is not None:
+                    return conn
+                self._mi_cache_db_lock = threading.Lock()
+                conn = sqlite3.connect(self.mi_cache_db_path, check_same_thread=False)
+                conn.execute('PRAGMA journal_mode=WAL')
+                conn.execute('PRAGMA synchronous=NORMAL')
+                conn.execute('''
+                    CREATE TABLE IF NOT EXISTS mi_cache (
+                        path TEXT PRIMARY KEY,
+                        mtime REAL,
+                        size INTEGER,
+                        json BLOB
+                    )
+                ''')
+                conn.commit()
+                self._mi_cache_db = conn
+        return conn
+
+    def _mi_cache_load(self, key):
+        # Look up a probe result persisted by an earlier run
+        conn = self._mi_cache_conn()
+        if conn is None:
+            return None
+        path, mtime, size = key
+        with self._mi_cache_db_lock:
+            row = conn.execute(
+                'SELECT json FROM mi_cache WHERE path = ? AND mtime = ? AND size = ?',
+                (path, mtime, size)
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            return self._bucket_tracks(_json_loads(row[0]))
+        except ValueError:
+            return None
+
+    def _mi_cache_store_many(self, rows):
+        # Persist probe results; one transaction per batch of (key, data) pairs
+        conn = self._mi_cache_conn()
+        if conn is None or not rows:
+            return
+        with self._mi_cache_db_lock:
+            conn.executemany(
+                'INSERT OR REPLACE INTO mi_cache (path, mtime, size, json) VALUES (?, ?, ?, ?)',
+                [(key[0], key[1], key[2], json.dumps(data)) for key, data in rows]
+            )
+            conn.commit()
+
+    def probe_all(self, file_paths):
+        """
+        Warm the probe cache for many files with one MediaInfo launch.
+        MediaInfo accepts multiple inputs and reports one JSON document per
+        file, so a single subprocess replaces N individual launches. Files
+        that cannot be batched (stat failure, unparsable output) are skipped
+        and get probed individually on first access instead.
+        """
+        if _PyMediaInfo is not None:
+            return  # In-process probes are already cheap; no batching needed
+        cache = getattr(self, '_mi_cache', None)
+        if cache is None:
+            cache = self._mi_cache = {}
+        pending = []
+        for file_path in file_paths:
+            try:
+                key = (file_path, os.path.getmtime(file_path), os.path.getsize(file_path))
+            except OSError:
+                continue
+            if key in cache:
+                continue
+            data = self._mi_cache_load(key)
+            if data is not None:
+                cache[key] = data
+                continue
+            pending.append(key)
+        for start in range(0, len(pending), self.PROBE_BATCH_SIZE):
+            batch = pending[start:start + self.PROBE_BATCH_SIZE]
+            try:
+                output = subprocess.check_output(
+                    [self.mediainfo_exe, '--Output=JSON'] + [key[0] for key in batch],
+                    creationflags=_NO_WINDOW
+                )
+                data = _json_loads(output)
+            except Exception:
+                continue  # Fall back to per-file probes for this batch
+            # A multi-file invocation emits a JSON array; a single file emits one object
+            entries = data if isinstance(data, list) else [data]
+            by_ref = {}
+            for entry in entries:
+                ref = entry.get('media', {}).get('@ref')
+                if ref:
+                    by_ref[ref] = entry
+            stored = []
+            for key in batch:
+                entry = by_ref.get(key[0])
+                if entry is not None:
+                    cache[key] = entry
+                    stored.append((key, entry))
+            self._mi_cache_store_many(stored)
+            for _, entry in stored:
+                self._bucket_tracks(entry)
+
+    def _probe(self, file_path):
+        """
+        Run MediaInfo once for the file and return the parsed JSON document.
+        Results are memoized on the worker instance keyed by (path, mtime, size)
+        so a file is re-probed only after it has been modified.
+        """
+        cache = getattr(self, '_mi_cache', None)
+        if cache is None:
+            cache = self._mi_cache = {}
+        global _PyMediaInfo
+        key = (file_path, os.path.getmtime(file_path), os.path.getsize(file_path))
+        data = cache.get(key)
+        if data is not None:
+            return data
+        data = self._mi_cache_load(key)
+        if data is not None:
+            cache[key] = data
+            return data
+        if _PyMediaInfo is not None:
+            # In-process probe: a library call instead of fork/exec + pipes
+            try:
+                data = _json_loads(_PyMediaInfo.parse(file_path, output='JSON'))
+            except OSError:
+                # libmediainfo is not usable; stop trying the binding
+                _PyMediaInfo = None
+        if data is None:
+            output = subprocess.check_output(
+                [self.mediainfo_exe, '--Output=JSON', file_path],
+                creationflags=_NO_WINDOW
+            )
+            data = _json_loads(output)
+        cache[key] = data
+        self._mi_cache_store_many([(key, data)])  # Stored before indexing keeps the blob lean
+        return self._bucket_tracks(data)
+
+    @staticmethod
+    def _bucket_tracks(data):
+        """
+        Attach a '_by_type' index to a probe document so consumers can jump
+        straight to the Video/Audio/General tracks instead of re-scanning the
+        full track list (subtitles, attachments, ...) at every call site.
+        """
+        if '_by_type' not in data:
+            by_type = {}
+            for track in data.get('media', {}).get('track', []):
+                by_type.setdefault(track.get('@type'), []).append(track)
+            data['_by_type'] = by_type
+        return data
+
+    def _probe_duration(self, file_path):
+        """
+        Fetch just the duration (in seconds) of a media file.
+        Uses MediaInfo's --Inform template so only a single scalar is emitted
+        and no JSON document has to be parsed; falls back to the full probe
+        when the template output is unusable. An already cached full probe is
+        reused instead of spawning a second MediaInfo process.
+        """
+        key = (file_path, os.path.getmtime(file_path), os.path.getsize(file_path))
+        cache = getattr(self, '_duration_cache', None)
+        if cache is None:
+            cache = self._duration_cache = {}
+        if key in cache:
+            return cache[key]
+        duration = None
+        data = getattr(self, '_mi_cache', {}).get(key)
+        if data is None and self.ffprobe_exe:
+            # ffprobe emits the bare number in seconds; cheapest probe available
+            try:
+                duration = float(subprocess.check_output([
+                    self.ffprobe_exe, '-v', 'error',
+                    '-show_entries', 'format=duration',
+                    '-of', 'csv=p=0', file_path
+                ], creationflags=_NO_WINDOW))
+            except (subprocess.CalledProcessError, OSError, ValueError):
+                duration = None
+        if data is None and duration is None:
+            output = subprocess.check_output(
+                [self.mediainfo_exe, '--Inform=General;%Duration%', file_path],
+                creationflags=_NO_WINDOW,
+                encoding='utf-8',
+                errors='replace',
+                text=True
+            ).strip()
+            try:
+                # The --Inform template reports the duration in milliseconds
+                duration = float(output) / 1000
+            except ValueError:
+                data = self._probe(file_path)  # Fall back to the full JSON probe
+        if duration is None and data is not None:
+            general_tracks = self._bucket_tracks(data)['_by_type'].get('General', ())
+            general_track = general_tracks[0] if general_tracks else None
+            duration_str = general_track.get('Duration') if general_track else None
+            if duration_str is not None:
+                try:
+                    duration = float(duration_str)
+                except ValueError:
+                    duration = None
+        cache[key] = duration
+        return duration
+
+class CheckMediaSignals(QObject):
+    # QRunnable cannot own signals itself; they live on this helper QObject
     progress = pyqtSignal(str)
     finished = pyqtSignal()
     clear_progress = pyqtSignal()
 
+class CheckMediaWorker(MediaInfoProber, QRunnable):
+
     def __init__(self, media_files, mediainfo_exe, mkvpropedit_exe, per_file_output_only=False):
         super().__init__()
+        self.setAutoDelete(False)  # The GUI keeps a Python reference to the worker
+        self.signals = CheckMediaSignals()
+        # Aliases so the run() body and the GUI keep their existing spelling
+        self.progress = self.signals.progress
+        self.finished = self.signals.finished
+        self.clear_progress = self.signals.clear_progress
         self.media_files = media_files
         self.mediainfo_exe = mediainfo_exe
         self.mkvpropedit_exe = mkvpropedit_exe
         self.per_file_output_only = per_file_output_only
+        self._mi_cache = {}  # Cache for MediaInfo probe results
+
+    # mkvpropedit can only rewrite Matroska containers, so only these are probed
+    MATROSKA_EXTS = ('.mkv', '.mka', '.mks', '.webm')
 
     def run(self):
         self.progress.emit("🚀 Starting media check...\n")
 
-        for idx, media in enumerate(self.media_files, start=1):
-            file_path = media['path']
-            file_name = os.path.basename(file_path)
-
-            if self.per_file_output_only:
-                self.clear_progress.emit()
-                self.progress.emit("🚀 Starting media check...\n")
+        # Warm the probe cache with a single batched MediaInfo launch
+        self.probe_all([media['path'] for media in self.media_files
+                        if media['path'].lower().endswith(self.MATROSKA_EXTS)])
+
+        # Each file is independent and the work is dominated by subprocess
+        # launches, so check them concurrently on a bounded thread pool.
+        max_workers = max(1, min(8, os.cpu_count() or 1, len(self.media_files) or 1))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self._check_one, media) for media in self.media_files]
+            for future in as_completed(futures):
+                messages = future.result()
+                if self.per_file_output_only:
+                    self.clear_progress.emit()
+                    self.progress.emit("🚀 Starting media check...\n")
+                for message in messages:
+                    self.progress.emit(message)
 
-            self.progress.emit(f"Checking: {file_name}")
+        self.progress.emit("✅ Media check completed.\n")
+        self.finished.emit()
 
-            needs_update = self.check_needs_update(file_path)
-            if not needs_update:
-                self.progress.emit(f"✅ No update needed for {file_name}\n")
-                continue
+    def _check_one(self, media):
+        """
+        Check and, if necessary, update a single media file.
+        Returns the progress messages for the file so the caller can emit
+        them as one block once the file has been processed.
+        """
+        messages = []
+        file_path = media['path']
+        file_name = os.path.basename(file_path)
 
-            attempts = 0
-            max_attempts = 2
-            success = False  # Initialize success flag
-            while needs_update and attempts < max_attempts:
-                self.progress.emit(f"🔄 Updating bitrate for {file_name} (Attempt {attempts + 1})")
-                update_success = self.update_duration(file_path)
-                if update_success:
-                    needs_update = self.check_needs_update(file_path)
-                    if not needs_update:
-                        self.progress.emit(f"✅ Successfully updated bitrate for {file_name} after {attempts + 1} attempts\n")
-                        success = True  # Mark as success
-                        break
-                else:
-                    self.progress.emit(f"❌ Failed to update bitrate for {file_name} on attempt {attempts + 1}\n")
+        # mkvpropedit cannot update other containers; don't waste a probe
+        if not file_path.lower().endswith(self.MATROSKA_EXTS):
+            messages.append(f"⏭ Skipping non-MKV: {file_name}\n")
+            return messages
+
+        messages.append(f"Checking: {file_name}")
+
+        needs_update = self.check_needs_update(file_path)
+        if not needs_update:
+            messages.append(f"✅ No update needed for {file_name}\n")
+            return messages
+
+        attempts = 0
+        max_attempts = 2
+        success = False  # Initialize success flag
+        while needs_update and attempts < max_attempts:
+            messages.append(f"🔄 Updating bitrate for {file_name} (Attempt {attempts + 1})")
+            update_success = self.update_duration(file_path)
+            if update_success:
+                needs_update = self.check_needs_update(file_path)
+                if not needs_update:
+                    messages.append(f"✅ Successfully updated bitrate for {file_name} after {attempts + 1} attempts\n")
+                    success = True  # Mark as success
                     break
-                attempts += 1
-            if not success and needs_update:
-                self.progress.emit(f"❌ Failed to update bitrate for {file_name} after {attempts} attempts\n")
+            else:
+                messages.append(f"❌ Failed to update bitrate for {file_name} on attempt {attempts + 1}\n")
+                break
+            attempts += 1
+        if not success and needs_update:
+            messages.append(f"❌ Failed to update bitrate for {file_name} after {attempts} attempts\n")
 
-        self.progress.emit("✅ Media check completed.\n")
-        self.finished.emit()
+        return messages
 
     def check_needs_update(self, file_path):
         """
@@ -191,30 +643,18 @@ class CheckMediaWorker(QThread):
         Returns True if either video or audio bitrate is "N/A" or missing.
         """
         try:
-            output = subprocess.check_output(
-                [self.mediainfo_exe, '--Output=JSON', file_path],
-                encoding='utf-8',
-                errors='replace',
-                text=True
-            )
-            data = json.loads(output)
-            tracks = data.get('media', {}).get('track', [])
-
-            # Initialize flags
-            video_bitrate_missing = False
-            audio_bitrate_missing = False
+            by_type = self._probe(file_path)['_by_type']
 
-            for track in tracks:
-                if track.get('@type') == 'Video':
-                    bitrate = track.get('BitRate')
-                    if not bitrate or str(bitrate).lower() == "n/a":
-                        video_bitrate_missing = True
-                elif track.get('@type') == 'Audio':
-                    bitrate = track.get('BitRate')
-                    if not bitrate or str(bitrate).lower() == "n/a":
-                        audio_bitrate_missing = True
+            for track in by_type.get('Video', ()):
+                bitrate = track.get('BitRate')
+                if not bitrate or str(bitrate).lower() == "n/a":
+                    return True
+            for track in by_type.get('Audio', ()):
+                bitrate = track.get('BitRate')
+                if not bitrate or str(bitrate).lower() == "n/a":
+                    return True
 
-            return video_bitrate_missing or audio_bitrate_missing
+            return False
         except Exception as e:
             self.progress.emit(f"Error checking {file_path}: {e}")
             return False
@@ -224,24 +664,103 @@ class CheckMediaWorker(QThread):
         Update the duration and bitrate information of the media file using mkvpropedit.
         """
         try:
-            for attempt in range(2):  # Run mkvpropedit twice
-                result = subprocess.run(
-                    [self.mkvpropedit_exe, file_path, '--add-track-statistics-tags'],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    encoding='utf-8',
-                    errors='replace',
-                    text=True
-                )
-                if result.returncode != 0:
-                    self.progress.emit(f"Error updating {file_path} on attempt {attempt + 1}: {result.stderr}")
-                    return False
+            # One invocation suffices: --add-track-statistics-tags is
+            # idempotent, and the retry loop in _check_one re-runs us anyway
+            # if the follow-up probe still reports missing bitrates
+            result = subprocess.run(
+                [self.mkvpropedit_exe, file_path, '--add-track-statistics-tags'],
+                creationflags=_NO_WINDOW,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                encoding='utf-8',
+                errors='replace',
+                text=True
+            )
+            if result.returncode != 0:
+                self.progress.emit(f"Error updating {file_path}: {result.stderr}")
+                return False
             return True
         except Exception as e:
             self.progress.emit(f"Exception updating {file_path}: {e}")
             return False
 
-class EncodingWorker(QThread):
+def _encode_sample(base_cmd, out_file, rf_value, progress_callback=None,
+                   abort_bytes=None):
+    """
+    Encode the extracted sample segment at one RF value.
+    base_cmd holds everything constant across probes (input, encoder,
+    preset, audio flags); only the output path and the -q value are added
+    here. Returns (size_bytes, aborted, error_output): on success
+    (size, False, None), on failure (None, False, handbrake_output).
+    When abort_bytes is given, the growing output file is statted at each
+    progress step past 10% and the encode is terminated once its projected
+    final size exceeds that ceiling, returning (projected, True, None) —
+    the probe already proved the RF is far off target. Standalone function
+    so several probe encodes can run concurrently, each writing to its own
+    output file. The output is streamed rather than buffered: only the last
+    lines are kept for error reporting, and progress_callback (if given)
+    receives the percentage roughly once per percent.
+    """
+    try:
+        os.remove(out_file)
+    except FileNotFoundError:
+        pass
+
+    command = base_cmd + ['-o', out_file, '-q', str(rf_value)]
+
+    creationflags = 0
+    if sys.platform.startswith('win'):
+        # High priority keeps probe throughput up when the app window is in
+        # the background, where Windows otherwise halves the encoder's FPS
+        creationflags = subprocess.HIGH_PRIORITY_CLASS | subprocess.CREATE_NO_WINDOW
+
+    proc = subprocess.Popen(
+        command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+        encoding='utf-8', errors='replace', bufsize=1,
+        creationflags=creationflags
+    )
+    tail = deque(maxlen=64)  # Bounded log tail, kept only for error reporting
+    last_pct = -1.0
+    for line in proc.stdout:
+        line = line.strip()
+        if not line:
+            continue
+        tail.append(line)
+        if progress_callback is None and abort_bytes is None:
+            continue
+        head, sep, _ = line.rpartition(' %')
+        if not sep:
+            continue
+        try:
+            pct = float(head.rsplit(None, 1)[-1])
+        except (ValueError, IndexError):
+            continue
+        if pct - last_pct < 1.0:
+            continue
+        last_pct = pct
+        if progress_callback is not None:
+            progress_callback(pct)
+        if abort_bytes is not None and pct >= 10.0:
+            try:
+                written = os.stat(out_file).st_size
+            except OSError:
+                written = 0
+            if written * 100.0 > abort_bytes * pct:
+                proc.terminate()
+                proc.stdout.close()
+                proc.wait()
+                return int(written * 100.0 / pct), True, None
+    proc.wait()
+    if proc.returncode != 0:
+        return None, False, '\n'.join(tail)
+    try:
+        # One stat covers both the existence check and the size read
+        return os.stat(out_file).st_size, False, None
+    except FileNotFoundError:
+        return None, False, '\n'.join(tail)
+
+class EncodingSignals(QObject):
+    # QRunnable cannot own signals itself; they live on this helper QObject
     progress = pyqtSignal(str)
     handbrake_output = pyqtSignal(str)
     overall_progress = pyqtSignal(int)
@@ -249,18 +768,46 @@ class EncodingWorker(QThread):
     current_file_progress = pyqtSignal(int)  # Signal for current file progress percentage
     clear_progress = pyqtSignal()  # New signal to clear progress areas
     finished = pyqtSignal()
-    delete_file_signal = pyqtSignal(str, str)  # file_path, delete_source_files_option
+    delete_batch_signal = pyqtSignal(list, str)  # file_paths, delete_source_files_option
+
+class EncodingWorker(MediaInfoProber, QRunnable):
+
+    # Successfully encoded sources are deleted in batches of this size so the
+    # GUI thread is not hit with file operations after every single encode
+    DELETE_BATCH_SIZE = 10
 
     def __init__(self, media_files, handbrake_cli, mediainfo_exe, target_size_mb, audio_bitrate,
                  preset_file, preset_name, destination_folder, per_file_output_only, delete_source_files,
                  selected_encoder, selected_audio_encoder, process_priority, selected_audio_tracks, variable_bitrate=False,
                  ffmpeg_exe=None, multi_pass=False):
         super().__init__()
+        self.setAutoDelete(False)  # The GUI keeps a Python reference to the worker
+        self.signals = EncodingSignals()
+        # Aliases so the run() body and the GUI keep their existing spelling
+        self.progress = self.signals.progress
+        self.handbrake_output = self.signals.handbrake_output
+        self.overall_progress = self.signals.overall_progress
+        self.current_file = self.signals.current_file
+        self.current_file_progress = self.signals.current_file_progress
+        self.clear_progress = self.signals.clear_progress
+        self.finished = self.signals.finished
+        self.delete_batch_signal = self.signals.delete_batch_signal
         self.media_files = media_files
         self.handbrake_cli = handbrake_cli
         self.mediainfo_exe = mediainfo_exe
         self.target_size_mb = target_size_mb
+        # Parse the target size once; calculate_video_bitrate runs per file
+        try:
+            self._target_size_mb_float = float(target_size_mb)
+        except (TypeError, ValueError):
+            self._target_size_mb_float = None
         self.audio_bitrate = audio_bitrate  # Can be a comma-separated string like "320,192"
+        # Split and validate the bitrate list once; it is constant for the batch
+        self._bitrate_values = [b.strip() for b in (audio_bitrate or '').split(',') if b.strip()]
+        try:
+            self._bitrate_ints = [int(b) for b in self._bitrate_values]
+        except ValueError:
+            self._bitrate_ints = None  # Reported per file in run()
         self.preset_file = preset_file
         self.preset_name = preset_name
         self.destination_folder = destination_folder
@@ -274,8 +821,20 @@ class EncodingWorker(QThread):
         self.selected_audio_tracks = selected_audio_tracks  # List[List[int]]
         self.variable_bitrate = variable_bitrate  # Existing attribute
         self.ffmpeg_exe = ffmpeg_exe  # Add this line to store ffmpeg_exe
+        if ffmpeg_exe:
+            # ffprobe ships alongside ffmpeg; use it for fast duration probes
+            candidate = os.path.join(
+                os.path.dirname(ffmpeg_exe),
+                'ffprobe.exe' if ffmpeg_exe.lower().endswith('.exe') else 'ffprobe'
+            )
+            if os.path.isfile(candidate):
+                self.ffprobe_exe = candidate
         self.multi_pass = multi_pass
         self.hardware_encoders = ['nvenc_h264', 'nvenc_h265', 'nvenc_h265_10bit']  # Define hardware encoders
+        self._mi_cache = {}  # Cache for MediaInfo probe results
+        self._pending_deletes = []  # Source files awaiting batched deletion
+        # Precomputed scale for overall progress; avoids a divide per output line
+        self._progress_scale = 100.0 / self.total_files if self.total_files else 0.0
 
     def is_hardware_encoder(self):
         return self.selected_encoder in self.hardware_encoders
@@ -284,13 +843,28 @@ class EncodingWorker(QThread):
         self.progress.emit("🚀 Starting encoding...\n")
         self.processed_files = 0  # Ensure it's reset at the start
 
-        for idx, media in enumerate(self.media_files, start=1):
+        # Warm the probe cache with a single batched MediaInfo launch
+        self.probe_all([media['path'] for media in self.media_files])
+
+        # Single helper thread that probes the next file while HandBrake
+        # encodes the current one, hiding metadata latency behind encoder time
+        prefetch_pool = ThreadPoolExecutor(max_workers=1)
+        prefetch_future = None
+
+        for idx, (media, selected_tracks) in enumerate(
+                zip(self.media_files, self.selected_audio_tracks), start=1):
             if self.per_file_output_only:
                 self.clear_progress.emit()
                 self.progress.emit("🚀 Starting encoding...\n")
 
+            if prefetch_future is not None:
+                # Make sure the prefetch finished before reading its caches
+                prefetch_future.result()
+                prefetch_future = None
+
             file_path = media['path']
             file_name = os.path.basename(file_path)
+            output_file = os.path.join(self.destination_folder, file_name)
             self.current_file.emit(f"Encoding File {idx} of {self.total_files}: {file_name}")
             self.progress.emit(f"Processing: {file_name}")
             self.current_file_progress.emit(0)  # Reset current file progress
@@ -313,21 +887,16 @@ class EncodingWorker(QThread):
                 audio_bitrate_info = f"{audio_bitrate_total} kbps (source, copy)"
                 selected_bitrate_values = [str(audio_bitrate_total)]  # Single value as a string
             else:
-                if self.audio_bitrate:
-                    # Split the bitrate string into a list to validate each value
-                    bitrate_values = [bitrate.strip() for bitrate in self.audio_bitrate.split(',')]
-                    try:
-                        # Validate that each bitrate is an integer
-                        bitrate_int_values = [int(bitrate) for bitrate in bitrate_values]
-                        audio_bitrate_info = f"{', '.join(bitrate_values)} kbps (specified)"
-                    except ValueError:
+                if self._bitrate_values:
+                    # Bitrates were split and validated once in __init__
+                    if self._bitrate_ints is None:
                         self.progress.emit(f"❌ Invalid audio bitrate specified for {file_name}. Ensure all values are integers separated by commas.\n")
                         self.update_overall_progress(self.processed_files, 0)
                         continue
+                    audio_bitrate_info = f"{', '.join(self._bitrate_values)} kbps (specified)"
 
-                    # **New Code: Extract only the bitrate values for the selected audio tracks**
-                    selected_tracks = self.selected_audio_tracks[idx - 1]  # Assuming idx starts at 1
-                    selected_bitrate_values = [bitrate_values[i] for i in selected_tracks if i < len(bitrate_values)]
+                    # Extract only the bitrate values for the selected audio tracks
+                    selected_bitrate_values = [self._bitrate_values[i] for i in selected_tracks if i < len(self._bitrate_values)]
 
                     # **Handle cases where selected_tracks might exceed the number of bitrate_values**
                     if len(selected_bitrate_values) != len(selected_tracks):
@@ -340,29 +909,12 @@ class EncodingWorker(QThread):
                     self.update_overall_progress(self.processed_files, 0)
                     continue
 
-            # Calculate video bitrate using only selected audio bitrates
-            video_bitrate = self.calculate_video_bitrate(duration, self.target_size_mb, selected_bitrate_values)
-            if video_bitrate is None:
-                self.progress.emit(f"❌ Failed to calculate video bitrate for {file_name}\n")
-                self.update_overall_progress(self.processed_files, 0)
-                continue
-
-            # Prepare summary of encoding settings
             duration_formatted = self.format_duration(duration)
-            encoding_summary = (
-                f"   • Duration: {duration_formatted}\n"
-                f"   • Target Size: {self.target_size_mb} MB\n"
-                f"   • Audio Bitrate: {audio_bitrate_info}\n"
-                f"   • Calculated Video Bitrate: {video_bitrate} kbps\n"
-                f"   • Preset: {self.preset_name}\n"
-                f"   • Encoder: {self.selected_encoder}\n"
-                f"   • Audio Encoder: {self.selected_audio_encoder}\n"
-            )
 
             # Now, handle variable_bitrate
             if self.variable_bitrate:
                 # Estimate RF value
-                estimated_rf_value = self.estimate_rf_value(file_path, float(self.target_size_mb), selected_bitrate_values)
+                estimated_rf_value = self.estimate_rf_value(file_path, self._target_size_mb_float, selected_bitrate_values)
                 if estimated_rf_value is None:
                     self.progress.emit(f"❌ Failed to estimate RF value for {file_name}\n")
                     self.update_overall_progress(self.processed_files, 0)
@@ -395,9 +947,6 @@ class EncodingWorker(QThread):
 
             self.progress.emit(encoding_summary)
 
-            # Prepare HandBrakeCLI command
-            output_file = self.get_output_file_path(file_path)
-
             # Construct the base command
             command = [
                 self.handbrake_cli,
@@ -440,7 +989,6 @@ class EncodingWorker(QThread):
                 command.extend(['-e', self.selected_encoder])
                 
             # Handle selected audio tracks
-            selected_tracks = self.selected_audio_tracks[idx - 1]  # Assuming idx starts at 1
             if selected_tracks:
                 # Convert 0-based indices to 1-based
                 selected_tracks_1_based = [str(i + 1) for i in selected_tracks]
@@ -448,7 +996,7 @@ class EncodingWorker(QThread):
                 command.extend(['-a', audio_tracks_str])
 
             # Set audio bitrate if specified, audio tracks are selected, and encoder is not 'copy' or 'None'
-            if self.audio_bitrate and selected_tracks and self.selected_audio_encoder not in ('copy', 'None'):
+            if self.audio_bitrate and selected_tracks and self.selected_audio_encoder not in _NO_AUDIO_BITRATE:
                 # Pass the comma-separated bitrate values directly
                 command.extend(['-B', self.audio_bitrate])
 
@@ -494,17 +1042,15 @@ class EncodingWorker(QThread):
 
                 process = subprocess.Popen(
                     full_command_with_prefix, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
-                    encoding='utf-8',
-                    errors='replace',
-                    text=True,
                     creationflags=creationflags
                 )
 
-                for line in process.stdout:
-                    if self.should_display_line(line):
-                        self.handbrake_output.emit(line.strip())
-                        # Parse progress from HandBrake output
-                        self.parse_handbrake_output(line.strip())
+                # Probe the next file in the background while this encode runs
+                if idx < self.total_files:
+                    prefetch_future = prefetch_pool.submit(
+                        self._prefetch_probe, self.media_files[idx]['path'])
+
+                self._stream_handbrake_output(process)
                 process.wait()
                 if process.returncode != 0:
                     self.progress.emit(f"❌ HandBrakeCLI exited with an error while processing {file_name}.\n")
@@ -514,8 +1060,10 @@ class EncodingWorker(QThread):
                     self.current_file_progress.emit(100)
                     self.progress.emit(f"✅ Completed: {file_name}\n")
 
-                    # Emit signal to handle source file deletion
-                    self.delete_file_signal.emit(file_path, self.delete_source_files)
+                    # Queue the source file for batched deletion
+                    self._pending_deletes.append(file_path)
+                    if len(self._pending_deletes) >= self.DELETE_BATCH_SIZE:
+                        self._flush_pending_deletes()
 
             except Exception as e:
                 self.progress.emit(f"❌ Error encoding {file_name}: {e}\n")
@@ -524,9 +1072,26 @@ class EncodingWorker(QThread):
             self.processed_files += 1
             self.update_overall_progress(self.processed_files, 0)  # Reset current file progress after completion
 
+        prefetch_pool.shutdown(wait=True)
+        self._flush_pending_deletes()  # Hand any remaining deletions to the GUI
         self.overall_progress.emit(100)  # Ensure overall progress is 100% at the end
         self.finished.emit()
 
+    def _prefetch_probe(self, file_path):
+        # Warm the probe caches for the upcoming file; failures are ignored
+        # here and surface normally when the main loop probes the file itself
+        try:
+            self._probe_duration(file_path)
+            self._probe(file_path)
+        except Exception:
+            pass
+
+    def _flush_pending_deletes(self):
+        # Emit the accumulated source files for deletion as one batch
+        if self._pending_deletes:
+            self.delete_batch_signal.emit(self._pending_deletes, self.delete_source_files)
+            self._pending_deletes = []
+
     def update_overall_progress(self, processed, current_file_progress):
         """
         Calculate and emit the overall progress.
@@ -535,56 +1100,35 @@ class EncodingWorker(QThread):
         self.overall_progress.emit(int(overall))
 
     def get_duration(self, file_path):
-        # Use MediaInfo to get the duration in seconds
+        # Use the lightweight scalar probe to get the duration in seconds
         try:
-            output = subprocess.check_output(
-                [self.mediainfo_exe, '--Output=JSON', file_path],
-                encoding='utf-8',
-                errors='replace',
-                text=True
-            )
-            data = json.loads(output)
-            general_track = next(track for track in data['media']['track'] if track['@type'] == 'General')
-            duration_str = general_track.get('Duration')
-
-            if duration_str is None:
+            duration_seconds = self._probe_duration(file_path)
+            if duration_seconds is None:
                 self.progress.emit(f"❌ Duration not found in MediaInfo output for {os.path.basename(file_path)}.\n")
                 return None
-
-            # Convert duration to float without dividing by 1000
-            duration_seconds = float(duration_str)
             return duration_seconds
         except Exception as e:
             self.progress.emit(f"❌ Error getting duration: {e}\n")
             return None
 
     def get_audio_bitrate(self, file_path):
-        # Use MediaInfo to get audio bitrate in kbps
+        # Use the cached MediaInfo probe to get audio bitrate in kbps
         try:
-            output = subprocess.check_output(
-                [self.mediainfo_exe, '--Output=JSON', file_path],
-                encoding='utf-8',
-                errors='replace',
-                text=True
+            audio_tracks = self._probe(file_path)['_by_type'].get('Audio', ())
+            audio_bitrate_total = sum(
+                float(track['BitRate']) / 1000  # Convert bps to kbps
+                for track in audio_tracks
+                if track.get('BitRate') and track['BitRate'] not in _NA_SENTINELS
             )
-            data = json.loads(output)
-            tracks = data.get('media', {}).get('track', [])
-            audio_bitrate_total = 0
-            audio_tracks = [track for track in tracks if track.get('@type') == 'Audio']
-            for track in audio_tracks:
-                bitrate_str = track.get('BitRate')
-                if bitrate_str and str(bitrate_str).lower() != "n/a":
-                    audio_bitrate_total += float(bitrate_str) / 1000  # Convert bps to kbps
             return int(audio_bitrate_total)
         except Exception as e:
             self.progress.emit(f"❌ Error getting audio bitrate: {e}\n")
             return None
 
     def calculate_video_bitrate(self, duration, target_size_mb, audio_bitrate_values):
-        # Validate and convert target_size_mb
-        try:
-            target_size_mb = float(self.target_size_mb)
-        except ValueError:
+        # Use the target size parsed once in __init__
+        target_size_mb = self._target_size_mb_float
+        if target_size_mb is None:
             self.progress.emit("❌ Invalid target size specified.\n")
             return None
 
@@ -624,35 +1168,109 @@ class EncodingWorker(QThread):
         # Filter out lines you don't want to display, if any
         return True  # Display all lines
 
+    def _stream_handbrake_output(self, process):
+        """
+        Read HandBrake's stdout in 4 KiB chunks instead of line by line.
+        HandBrake rewrites its progress line with carriage returns many times
+        per second; per chunk, only the last progress line is parsed and all
+        displayable lines are emitted as one batched signal, which keeps the
+        cross-thread signal traffic to the GUI low.
+        """
+        residual = b''
+        while True:
+            # read1 returns whatever is available instead of blocking until
+            # a full 4 KiB accumulates; HandBrake's throttled progress line
+            # would otherwise stall the bars for many seconds between reads
+            chunk = process.stdout.read1(4096)
+            if not chunk:
+                break
+            residual += chunk
+            lines = residual.replace(b'\r\n', b'\n').replace(b'\r', b'\n').split(b'\n')
+            residual = lines.pop()  # Incomplete tail, kept for the next chunk
+            display_batch = []
+            last_progress_line = None
+            for raw_line in lines:
+                line = raw_line.decode('utf-8', errors='replace').strip()
+                if not line or not self.should_display_line(line):
+                    continue
+                if ' %' in line:
+                    # Coalesce progress spam: only the newest line matters
+                    last_progress_line = line
+                else:
+                    display_batch.append(line)
+            if last_progress_line is not None:
+                display_batch.append(last_progress_line)
+                self.parse_handbrake_output(last_progress_line)
+            if display_batch:
+                self.handbrake_output.emit('\n'.join(display_batch))
+        if residual:
+            line = residual.decode('utf-8', errors='replace').strip()
+            if line and self.should_display_line(line):
+                self.handbrake_output.emit(line)
+                self.parse_handbrake_output(line)
+
     def parse_handbrake_output(self, line):
         """
         Parse HandBrakeCLI output to extract progress percentage and update the current file progress bar.
         """
-        match = re.search(r'(\d+\.\d+) %', line)
-        if match:
-            percentage = float(match.group(1))
-            # Calculate overall progress based on the instance variable
-            overall = (self.processed_files + (percentage / 100)) / self.total_files * 100
-            self.overall_progress.emit(int(overall))
-            self.current_file_progress.emit(int(percentage))
-        else:
-            # Handle integer percentages
-            match = re.search(r'(\d+) %', line)
-            if match:
-                percentage = int(match.group(1))
-                overall = (self.processed_files + (percentage / 100)) / self.total_files * 100
-                self.overall_progress.emit(int(overall))
-                self.current_file_progress.emit(int(percentage))
+        # Progress lines look like "Encoding: task 1 of 1, 12.34 %"; the
+        # number before ' %' can be sliced out without the regex engine
+        head, sep, _ = line.rpartition(' %')
+        if not sep:
+            return
+        try:
+            percentage = float(head.rsplit(None, 1)[-1])
+        except (ValueError, IndexError):
+            return
+        # Calculate overall progress based on the instance variable
+        overall = (self.processed_files + (percentage / 100)) * self._progress_scale
+        self.overall_progress.emit(int(overall))
+        self.current_file_progress.emit(int(percentage))
 
     def format_duration(self, seconds):
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
+        hours, rem = divmod(int(seconds), 3600)
+        minutes, secs = divmod(rem, 60)
         if hours > 0:
             return f"{hours}h {minutes}m {secs}s"
         else:
             return f"{minutes}m {secs}s"
 
+    def _sample_cache_key(self):
+        # Encode parameters that determine the output size for a given sample
+        return (
+            self.selected_encoder or '',
+            self.preset_name or '',
+            f"{self.selected_audio_encoder or ''}|{self.audio_bitrate or ''}",
+        )
+
+    def _sample_cache_lookup(self, sample_hash, rf_value):
+        # HandBrake output size is deterministic for a fixed input and
+        # parameters, so previously measured probe sizes can be reused
+        conn = self._mi_cache_conn()
+        if conn is None or sample_hash is None:
+            return None
+        encoder, preset, audio = self._sample_cache_key()
+        with self._mi_cache_db_lock:
+            row = conn.execute(
+                'SELECT size FROM sample_size_cache '
+                'WHERE hash = ? AND encoder = ? AND preset = ? AND audio = ? AND rf = ?',
+                (sample_hash, encoder, preset, audio, rf_value)
+            ).fetchone()
+        return row[0] if row else None
+
+    def _sample_cache_store(self, sample_hash, rf_value, size_bytes):
+        conn = self._mi_cache_conn()
+        if conn is None or sample_hash is None:
+            return
+        encoder, preset, audio = self._sample_cache_key()
+        with self._mi_cache_db_lock:
+            conn.execute(
+                'INSERT OR REPLACE INTO sample_size_cache (hash, encoder, preset, audio, rf, size) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (sample_hash, encoder, preset, audio, rf_value, size_bytes)
+            )
+            conn.commit()
+
     def estimate_rf_value(self, file_path, target_size_mb, audio_bitrate_values):
         try:
             # Get duration of the video
@@ -666,15 +1284,14 @@ class EncodingWorker(QThread):
             sample_duration = duration * sample_percentage
             sample_start = (duration - sample_duration) / 2  # Start from the middle
 
-            # Prepare temporary file paths
+            # Prepare temporary file paths; encoded probes get per-RF names so
+            # concurrent encodes cannot collide on one output file
             temp_sample_file = os.path.join(self.destination_folder, 'temp_sample.mkv')
-            temp_encoded_sample = os.path.join(self.destination_folder, 'temp_encoded_sample.mkv')
 
-            # Remove temp files if they exist
-            if os.path.exists(temp_sample_file):
+            try:
                 os.remove(temp_sample_file)
-            if os.path.exists(temp_encoded_sample):
-                os.remove(temp_encoded_sample)
+            except FileNotFoundError:
+                pass
 
             # Use ffmpeg to extract the sample segment
             ffmpeg_cmd = [
@@ -687,104 +1304,158 @@ class EncodingWorker(QThread):
                 temp_sample_file
             ]
             self.progress.emit("🔍 Extracting sample segment for estimation...")
-            result = subprocess.run(ffmpeg_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, encoding='utf-8', errors='replace')
+            # Stream-copy remux: stdout is noise, stderr only matters on failure
+            result = subprocess.run(ffmpeg_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                    creationflags=_NO_WINDOW)
             if result.returncode != 0:
-                self.progress.emit(f"❌ Error extracting sample segment: {result.stderr}\n")
+                stderr_text = result.stderr.decode('utf-8', errors='replace')
+                self.progress.emit(f"❌ Error extracting sample segment: {stderr_text}\n")
                 return None
 
+            # Fingerprint the sample so probe sizes can be reused across runs
+            # (and across files cut from the same source)
+            try:
+                with open(temp_sample_file, 'rb') as sample_f:
+                    sample_hash = hashlib.blake2b(sample_f.read(4 * 1024 * 1024)).hexdigest()
+            except OSError:
+                sample_hash = None
+
             # Set acceptable size range (±5% of target size)
             acceptable_lower_size = target_size_mb * 0.95
             acceptable_upper_size = target_size_mb * 1.05
 
-            # Initialize variables for the Bisection Method
-            lower_rf = 18
-            upper_rf = 40
-            rf_value = (lower_rf + upper_rf) / 2
-            max_iterations = 10
-            iteration = 0
-
-            while iteration < max_iterations:
-                iteration += 1
+            # Audio contribution is independent of the RF value
+            total_audio_bitrate_kbps = sum([float(bitrate) for bitrate in audio_bitrate_values])
+            total_audio_size_bytes = (total_audio_bitrate_kbps * 1000 / 8) * duration  # Convert kbps to bytes per second
 
-                # Prepare HandBrakeCLI command to encode the sample segment
-                command = [
-                    self.handbrake_cli,
-                    '-i', temp_sample_file,
-                    '-o', temp_encoded_sample,
-                    '-e', self.selected_encoder,
-                    '-q', str(rf_value)
-                ]
-
-                # Add preset if specified
-                if self.preset_file and self.preset_name:
-                    command.extend([
-                        '--preset-import-file', self.preset_file,
-                        '-Z', self.preset_name,
-                    ])
-                else:
-                    command.append('--all-subtitles')  # Include subtitles if not using a preset
-
-                # Add audio encoder if specified and not 'None'
-                if self.selected_audio_encoder and self.selected_audio_encoder != 'None':
-                    command.extend(['-E', self.selected_audio_encoder])
-                    # Include audio bitrate if specified
-                    if self.audio_bitrate:
-                        command.extend(['-B', self.audio_bitrate])
-
-                # Run HandBrakeCLI on the sample
-                self.progress.emit(f"🔄 Encoding sample segment for estimation (RF={rf_value:.2f})...")
-                result = subprocess.run(
-                    command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
-                    encoding='utf-8', errors='replace'
-                )
-                if result.returncode != 0:
-                    self.progress.emit(f"❌ Error encoding sample segment: {result.stdout}\n")
-                    return None
+            # Everything but the output path and -q is constant across probes
+            base_cmd = [
+                self.handbrake_cli,
+                '-i', temp_sample_file,
+                '-e', self.selected_encoder,
+            ]
 
-                # Check if temp_encoded_sample exists
-                if not os.path.exists(temp_encoded_sample):
-                    self.progress.emit(f"❌ temp_encoded_sample.mkv was not created. Possible encoding error.\n")
-                    self.progress.emit(f"HandBrakeCLI output:\n{result.stdout}\n")
-                    return None
+            # Add preset if specified
+            if self.preset_file and self.preset_name:
+                base_cmd.extend([
+                    '--preset-import-file', self.preset_file,
+                    '-Z', self.preset_name,
+                ])
+            else:
+                base_cmd.append('--all-subtitles')  # Include subtitles if not using a preset
 
-                # Measure the size of the encoded sample
-                sample_size_bytes = os.path.getsize(temp_encoded_sample)
+            # Add audio encoder if specified and not 'None'
+            if self.selected_audio_encoder and self.selected_audio_encoder != 'None':
+                base_cmd.extend(['-E', self.selected_audio_encoder])
+                # Include audio bitrate if specified
+                if self.audio_bitrate:
+                    base_cmd.extend(['-B', self.audio_bitrate])
+
+            # Stop a probe early once its projected sample size blows far
+            # (1.5x) past the upper acceptable size; the video share of that
+            # ceiling scaled to the sample window is what the file may reach
+            abort_sample_bytes = (
+                (acceptable_upper_size * 1.5 * 1024 * 1024) - total_audio_size_bytes
+            ) * (sample_duration / duration)
+            if abort_sample_bytes <= 0:
+                abort_sample_bytes = None
+
+            def measure(rf_value):
+                """
+                Encode the sample at the given RF and return the projected
+                total size in MB, or None on encoder failure.
+                """
+                size_bytes = self._sample_cache_lookup(sample_hash, rf_value)
+                if size_bytes is None:
+                    out_file = os.path.join(
+                        self.destination_folder, f'temp_encoded_sample_rf{rf_value:.2f}.mkv')
+                    self.progress.emit(f"🔄 Encoding sample segment for estimation (RF={rf_value:.2f})...")
+                    size_bytes, aborted, error_output = _encode_sample(
+                        base_cmd, out_file, rf_value,
+                        progress_callback=lambda pct: self.progress.emit(
+                            f"🔄 Sample encode RF={rf_value:.2f}: {pct:.0f}%"),
+                        abort_bytes=abort_sample_bytes
+                    )
+                    # The per-RF output file is left in place; cleanup() sweeps
+                    # them all at once, avoiding a just-closed-file unlink that
+                    # Windows AV scanners love to stall on
+                    if size_bytes is None:
+                        self.progress.emit(f"❌ Error encoding sample segment: {error_output}\n")
+                        return None
+                    if aborted:
+                        # Projected size, good enough to steer the search but
+                        # too imprecise to persist in the sample cache
+                        self.progress.emit(f"⏹ Aborted sample encode at RF={rf_value:.2f}: projected size is far above target")
+                    else:
+                        self._sample_cache_store(sample_hash, rf_value, size_bytes)
+                else:
+                    self.progress.emit(f"📦 Reusing cached sample size for RF={rf_value:.2f}")
 
-                # Estimate the total size based on sample
-                estimated_video_size_bytes = sample_size_bytes * (duration / sample_duration)
+                # Project the full-length size from the sample size
+                estimated_video_size_bytes = size_bytes * (duration / sample_duration)
+                estimated_total_size_mb = (estimated_video_size_bytes + total_audio_size_bytes) / (1024 * 1024)
 
-                # Calculate total estimated size including audio
-                total_audio_bitrate_kbps = sum([float(bitrate) for bitrate in audio_bitrate_values])
-                total_audio_size_bytes = (total_audio_bitrate_kbps * 1000 / 8) * duration  # Convert kbps to bytes per second
+                self.progress.emit(f"📊 Estimated total size with RF={rf_value:.2f}: {estimated_total_size_mb:.2f} MB\n")
+                return estimated_total_size_mb
 
-                estimated_total_size_bytes = estimated_video_size_bytes + total_audio_size_bytes
-                estimated_total_size_mb = estimated_total_size_bytes / (1024 * 1024)
+            def cleanup():
+                try:
+                    os.remove(temp_sample_file)
+                except FileNotFoundError:
+                    pass
+                for leftover in glob.glob(os.path.join(self.destination_folder, 'temp_encoded_sample_rf*.mkv')):
+                    try:
+                        os.remove(leftover)
+                    except OSError:
+                        pass
 
-                self.progress.emit(f"📊 Estimated total size with RF={rf_value:.2f}: {estimated_total_size_mb:.2f} MB\n")
+            max_iterations = 10
+            samples = []  # (rf, estimated_total_size_mb) pairs measured so far
+
+            # Encoded size falls roughly log-linearly with RF for x264/x265,
+            # so two well-separated probes let us fit log(size) = a - b*rf and
+            # solve for the target directly instead of bisecting from scratch.
+            # The probes are independent, so they run concurrently; a short
+            # sample rarely saturates the machine on its own.
+            with ThreadPoolExecutor(max_workers=2) as probe_pool:
+                probe_futures = [(rf, probe_pool.submit(measure, rf)) for rf in (22.0, 32.0)]
+                probe_results = [(rf, future.result()) for rf, future in probe_futures]
+            for rf_value, size_mb in probe_results:
+                if size_mb is None:
+                    cleanup()
+                    return None
+                if acceptable_lower_size <= size_mb <= acceptable_upper_size:
+                    cleanup()
+                    return round(rf_value, 2)
+                samples.append((rf_value, size_mb))
 
-                # Check if the estimated size is within the acceptable range
-                if acceptable_lower_size <= estimated_total_size_mb <= acceptable_upper_size:
-                    # Within acceptable range
+            (rf1, s1), (rf2, s2) = samples
+            try:
+                b = (math.log(s1) - math.log(s2)) / (rf2 - rf1)
+                a = math.log(s1) + b * rf1
+                rf_value = (a - math.log(target_size_mb)) / b
+                rf_value = min(40.0, max(18.0, rf_value))
+            except (ValueError, ZeroDivisionError):
+                rf_value = (18 + 40) / 2  # Degenerate fit; fall back to plain bisection
+
+            iteration = len(samples)
+            while iteration < max_iterations:
+                iteration += 1
+                size_mb = measure(rf_value)
+                if size_mb is None:
+                    cleanup()
+                    return None
+                if acceptable_lower_size <= size_mb <= acceptable_upper_size:
                     break
+                samples.append((rf_value, size_mb))
 
-                # Adjust RF bounds based on estimated size
-                if estimated_total_size_mb > acceptable_upper_size:
-                    # Estimated size is too large; increase RF
-                    lower_rf = rf_value
-                else:
-                    # Estimated size is too small; decrease RF
-                    upper_rf = rf_value
-
-                # Update RF value for next iteration
+                # Prediction missed; bisect using the measured samples as the
+                # bracket (size decreases as RF increases)
+                lower_rf = max((rf for rf, s in samples if s > acceptable_upper_size), default=18)
+                upper_rf = min((rf for rf, s in samples if s < acceptable_lower_size), default=40)
                 rf_value = (lower_rf + upper_rf) / 2
 
-                # Clean up temporary encoded sample
-                os.remove(temp_encoded_sample)
-
-            # Clean up temporary files
-            os.remove(temp_sample_file)
-            if os.path.exists(temp_encoded_sample):
-                os.remove(temp_encoded_sample)
+            cleanup()
 
             # Return the estimated RF value
             return round(rf_value, 2)
@@ -793,70 +1464,52 @@ class EncodingWorker(QThread):
             self.progress.emit(f"❌ Error during estimation: {e}\n")
             return None
 
-class AddMediaWorker(QThread):
+class AddMediaWorker(MediaInfoProber, QThread):
     progress = pyqtSignal(list)  # Existing signal to emit media info
     log = pyqtSignal(str)        # New signal to emit log messages
     finished = pyqtSignal()
 
-    def __init__(self, file_paths, mediainfo_exe):
+    # Rows per progress emission; large drops insert in chunks of this size
+    # while small drops still show up promptly
+    EMIT_BATCH_SIZE = 25
+
+    def __init__(self, file_paths, mediainfo_exe, known_sizes=None):
         super().__init__()
         self.file_paths = file_paths
         self.mediainfo_exe = mediainfo_exe
-
-    def get_full_language_name(self, language_str):
-        """
-        Converts language codes to their full language names using pycountry.
-        If the language_str is already a full name or unknown, it returns it as is.
-        """
-        # Split multiple languages if present (e.g., 'en,fr')
-        languages = [lang.strip() for lang in language_str.split(',')]
-        full_languages = []
-        for lang in languages:
-            if not lang:
-                continue  # Skip empty strings
-            # Attempt to get the language by alpha_2 code
-            language = pycountry.languages.get(alpha_2=lang.lower())
-            if language:
-                full_name = language.name
-            else:
-                # Attempt to get the language by alpha_3 code
-                language = pycountry.languages.get(alpha_3=lang.lower())
-                if language:
-                    full_name = language.name
-                else:
-                    # Attempt to get the language by name
-                    try:
-                        language = pycountry.languages.lookup(lang)
-                        full_name = language.name
-                    except LookupError:
-                        full_name = lang  # Fallback to original string if not found
-            full_languages.append(full_name)
-        # Join multiple languages back into a string
-        return ', '.join(full_languages)
+        # File sizes already collected by the caller (e.g. from the drop
+        # traversal's directory entries); spares a stat per file
+        self.known_sizes = known_sizes or {}
+        self._mi_cache = {}  # Cache for MediaInfo probe results
 
     def run(self):
-        media_files = []
-        for file_path in self.file_paths:
-            if self.is_media_file(file_path):
-                media_info = self.get_media_info(file_path)
-                if media_info:
-                    media_files.append(media_info)
-                    self.progress.emit([media_info])  # Emit media info as soon as it's ready
+        # Callers pre-filter to media extensions before starting the worker
+        media_paths = self.file_paths
+        if media_paths:
+            # Probe the whole drop with batched MediaInfo launches up front;
+            # the pool below then works from the warm cache and only probes
+            # individually for files the batch could not handle
+            self.probe_all(media_paths)
+            # Emit results in groups so the GUI-side bulk insert really gets
+            # batches: per-row emissions made _bulk_add_media toggle sorting
+            # (and re-sort the tree) once per inserted row
+            batch = []
+            with ThreadPoolExecutor(max_workers=min(16, len(media_paths))) as executor:
+                for media_info in executor.map(self.get_media_info, media_paths):
+                    if media_info:
+                        batch.append(media_info)
+                        if len(batch) >= self.EMIT_BATCH_SIZE:
+                            self.progress.emit(batch)
+                            batch = []
+            if batch:
+                self.progress.emit(batch)
         self.finished.emit()
 
-    def is_media_file(self, file_path):
-        return file_path.lower().endswith(('.mp4', '.mkv', '.avi', '.mov'))
-
     def get_media_info(self, file_path):
         try:
-            output = subprocess.check_output(
-                [self.mediainfo_exe, '--Output=JSON', file_path],
-                encoding='utf-8',
-                errors='replace',
-                text=True
-            )
-            data = json.loads(output)
+            data = self._probe(file_path)
             tracks = data.get('media', {}).get('track', [])
+            known_size = self.known_sizes.get(file_path)
 
             # Initialize variables
             general_track = None
@@ -882,15 +1535,9 @@ class AddMediaWorker(QThread):
             if not general_track or not video_track or not audio_tracks:
                 raise ValueError("Missing required track information.")
 
-            file_size = os.path.getsize(file_path)
-
-            # Define a function to format bitrate with '.' as thousands separator
-            def format_bitrate_kbps(value):
-                s = f"{value:,.0f}"  # Format with ',' as thousands separator
-                return s.replace(',', '.')
+            file_size = known_size if known_size is not None else os.path.getsize(file_path)
 
             # Video bitrate formatting with enhanced handling
-            video_info_list = []
             if video_track:
                 # Collect video details
                 video_codec = video_track.get('Format', 'Unknown')
@@ -899,26 +1546,17 @@ class AddMediaWorker(QThread):
                 if video_bitrate and str(video_bitrate).lower() != "n/a":
                     try:
                         video_bitrate_float = float(video_bitrate) / 1000  # Convert to kbps
-                        video_bitrate_formatted = format_bitrate_kbps(video_bitrate_float)
+                        video_bitrate_formatted = _format_bitrate_kbps(video_bitrate_float)
                     except ValueError:
                         pass
 
-                # Resolution
-                width = video_track.get('Width', 'Unknown')
-                height = video_track.get('Height', 'Unknown')
-                resolution = f"{width}x{height}"
-
-                # Frame rate
-                frame_rate = video_track.get('FrameRate', 'Unknown')
-
-                # Build video info list
-                video_info_list.append(f"Codec: {video_codec}")
-                video_info_list.append(f"Bitrate: {video_bitrate_formatted} kbps")
-                video_info_list.append(f"Resolution: {resolution}")
-                video_info_list.append(f"Frame Rate: {frame_rate} fps")
-
-                # Combine into multi-line string
-                video_info = "\n".join(video_info_list)
+                # Build the multi-line tooltip string in one join
+                video_info = "\n".join((
+                    f"Codec: {video_codec}",
+                    f"Bitrate: {video_bitrate_formatted} kbps",
+                    f"Resolution: {video_track.get('Width', 'Unknown')}x{video_track.get('Height', 'Unknown')}",
+                    f"Frame Rate: {video_track.get('FrameRate', 'Unknown')} fps",
+                ))
                 # For display in the column, use a summary
                 video_summary = f"{video_codec} {video_bitrate_formatted} kbps"
             else:
@@ -928,33 +1566,24 @@ class AddMediaWorker(QThread):
             # Audio bitrate and language formatting
             audio_info_list = []
             for idx, audio_track in enumerate(audio_tracks, start=1):
+                audio_codec = audio_track.get('Format', 'Unknown')
                 bitrate_str = audio_track.get('BitRate')
                 language_str = audio_track.get('Language/String') or audio_track.get('Language') or "Unknown"
                 # Convert language codes to full names using the shared function
                 full_language = get_full_language_name(language_str)
                 if isinstance(full_language, list):
                     full_language = ', '.join(full_language)
-                if bitrate_str and isinstance(bitrate_str, (int, float, str)) and str(bitrate_str).lower() != "n/a":
-                    try:
-                        bitrate_float = float(bitrate_str) / 1000  # Convert to kbps
-                        audio_codec = audio_track.get('Format', 'Unknown')
-                        bitrate_display = f"{int(bitrate_float)} kbps" if bitrate_float else "Unknown Bitrate"
-                    except ValueError:
-                        bitrate_display = "Unknown Bitrate"
-                else:
-                    bitrate_display = "Unknown Bitrate"
-
-                # Retrieve the Title if available
-                title = audio_track.get('Title', '').strip()
+                bitrate_display = _format_bitrate(bitrate_str)
 
-                if title:
-                    # Include the Title in the display if it exists
-                    audio_info = f"{idx}: {title} - {audio_track.get('Format', 'Unknown')} {bitrate_display} [{full_language}]"
-                else:
-                    # Fallback to original format if Title is not available
-                    audio_info = f"{idx}: {audio_track.get('Format', 'Unknown')} {bitrate_display} [{full_language}]"
+                # Cache the codec/bitrate display on the track so the
+                # audio-selection accept path can reuse it instead of
+                # re-parsing BitRate for every selected row
+                audio_track['_display'] = f"{audio_codec} {bitrate_display}"
 
-                audio_info_list.append(audio_info)
+                # Include the Title in the display if it exists
+                title = audio_track.get('Title', '').strip()
+                title_part = f"{title} - " if title else ""
+                audio_info_list.append(f"{idx}: {title_part}{audio_codec} {bitrate_display} [{full_language}]")
 
             audio_info = "\n".join(audio_info_list)
 
@@ -972,20 +1601,19 @@ class AddMediaWorker(QThread):
                     duration_seconds = None
 
             # Return info as a dict
-            info = {
-                'filename': os.path.basename(file_path),
-                'duration': duration_formatted,
-                'duration_seconds': duration_seconds,
-                'video': video_summary,      # Display summary in the column
-                'video_info': video_info,    # Store detailed info for tooltip
-                'audio': audio_info,
-                'size': f"{int(file_size / (1024 * 1024))} MB",
-                'size_bytes': file_size,
-                'total_audio_bitrate_kbps': total_audio_bitrate_kbps,  # Store total audio bitrate
-                'path': file_path,
-                'audio_tracks': audio_tracks  # Store all audio tracks for selection
-            }
-            return info
+            return MediaInfo(
+                filename=os.path.basename(file_path),
+                duration=duration_formatted,
+                duration_seconds=duration_seconds,
+                video=video_summary,         # Display summary in the column
+                video_info=video_info,       # Store detailed info for tooltip
+                audio=audio_info,
+                size=f"{int(file_size / (1024 * 1024))} MB",
+                size_bytes=file_size,
+                total_audio_bitrate_kbps=total_audio_bitrate_kbps,
+                path=file_path,
+                audio_tracks=audio_tracks    # Store all audio tracks for selection
+            )
         except Exception as e:
             self.update_progress(f"Error getting media info for {file_path}: {e}")
             return None
@@ -995,9 +1623,8 @@ class AddMediaWorker(QThread):
         Formats duration from seconds to HH:MM:SS format.
         """
         try:
-            hours = int(duration_seconds // 3600)
-            minutes = int((duration_seconds % 3600) // 60)
-            seconds = int(duration_seconds % 60)
+            hours, rem = divmod(int(duration_seconds), 3600)
+            minutes, seconds = divmod(rem, 60)
             return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
         except:
             return "Unknown"
@@ -1012,55 +1639,9 @@ class MediaListWidget(QTreeWidget):
         self.setContextMenuPolicy(Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(self.open_context_menu)
 
-        # Initialize custom tooltip widget for Audio column
-        self.audio_tooltip = QLabel(self)
-        self.audio_tooltip.setWindowFlags(Qt.ToolTip | Qt.FramelessWindowHint)
-        self.audio_tooltip.setStyleSheet("""
-            QLabel {
-                background-color: #FFFFFF;  /* White Background */
-                color: #000000;             /* Black Text */
-                border: 1px solid #A0A0A0;  /* Gray Border */
-                padding: 5px;
-                font-size: 9pt;             /* Increased Font Size */
-            }
-        """)
-        self.audio_tooltip.setVisible(False)
-
-        # Initialize custom tooltip widget for Video column
-        self.video_tooltip = QLabel(self)
-        self.video_tooltip.setWindowFlags(Qt.ToolTip | Qt.FramelessWindowHint)
-        self.video_tooltip.setStyleSheet("""
-            QLabel {
-                background-color: #FFFFFF;  /* White Background */
-                color: #000000;             /* Black Text */
-                border: 1px solid #A0A0A0;  /* Gray Border */
-                padding: 5px;
-                font-size: 9pt;             /* Increased Font Size */
-            }
-        """)
-        self.video_tooltip.setVisible(False)
-
-        # Initialize hover timers for delayed tooltip display
-        self.hover_timer_audio = QTimer(self)
-        self.hover_timer_audio.setSingleShot(True)
-        self.hover_timer_audio.timeout.connect(self.show_audio_tooltip)
-
-        self.hover_timer_video = QTimer(self)
-        self.hover_timer_video.setSingleShot(True)
-        self.hover_timer_video.timeout.connect(self.show_video_tooltip)
-
-        # Variables to track the current hovered item and column for Audio
-        self.current_hover_item_audio = None
-        self.current_hover_column_audio = -1
-        self.last_hover_pos_audio = QPoint()
-
-        # Variables to track the current hovered item and column for Video
-        self.current_hover_item_video = None
-        self.current_hover_column_video = -1
-        self.last_hover_pos_video = QPoint()
-
-        # Enable mouse tracking to receive mouseMoveEvent without mouse buttons pressed
-        self.setMouseTracking(True)
+        # Audio/Video tooltips use Qt's native tooltip support: the texts are
+        # set per item at creation time and Qt handles the hover delay and
+        # positioning in C++, so no per-mouse-move Python code runs at all
 
         # Connect the selectionChanged signal to ensure at least one item is always selected
         self.selectionModel().selectionChanged.connect(self.on_selection_changed)
@@ -1071,93 +1652,6 @@ class MediaListWidget(QTreeWidget):
         else:
             super().keyPressEvent(event)
 
-    def mouseMoveEvent(self, event):
-        pos = event.pos()
-        item = self.itemAt(pos)
-        column = self.columnAt(pos.x())
-
-        if item and column == COL_AUDIO:
-            if (item != self.current_hover_item_audio) or (column != self.current_hover_column_audio):
-                # Mouse has moved to a different item or column
-                self.hover_timer_audio.stop()
-                self.current_hover_item_audio = item
-                self.current_hover_column_audio = column
-                self.last_hover_pos_audio = self.viewport().mapToGlobal(pos)
-                self.hover_timer_audio.start(1000)  # Start 1-second timer for tooltip
-                self.audio_tooltip.setVisible(False)  # Hide tooltip until timer triggers
-                self.video_tooltip.setVisible(False)  # Hide video tooltip
-                self.hover_timer_video.stop()  # Stop video timer if running
-        elif item and column == COL_VIDEO:
-            if (item != self.current_hover_item_video) or (column != self.current_hover_column_video):
-                # Mouse has moved to a different item or column
-                self.hover_timer_video.stop()
-                self.current_hover_item_video = item
-                self.current_hover_column_video = column
-                self.last_hover_pos_video = self.viewport().mapToGlobal(pos)
-                self.hover_timer_video.start(1000)  # Start 1-second timer for tooltip
-                self.video_tooltip.setVisible(False)  # Hide tooltip until timer triggers
-                self.audio_tooltip.setVisible(False)  # Hide audio tooltip
-                self.hover_timer_audio.stop()  # Stop audio timer if running
-        else:
-            # Mouse is not over the Audio or Video column
-            self.hover_timer_audio.stop()
-            self.current_hover_item_audio = None
-            self.current_hover_column_audio = -1
-            self.audio_tooltip.setVisible(False)  # Hide audio tooltip
-
-            self.hover_timer_video.stop()
-            self.current_hover_item_video = None
-            self.current_hover_column_video = -1
-            self.video_tooltip.setVisible(False)  # Hide video tooltip
-
-        super().mouseMoveEvent(event)
-
-    def leaveEvent(self, event):
-        # Hide tooltips when the mouse leaves the widget
-        self.hover_timer_audio.stop()
-        self.current_hover_item_audio = None
-        self.current_hover_column_audio = -1
-        self.audio_tooltip.setVisible(False)
-
-        self.hover_timer_video.stop()
-        self.current_hover_item_video = None
-        self.current_hover_column_video = -1
-        self.video_tooltip.setVisible(False)
-        super().leaveEvent(event)
-
-    def show_audio_tooltip(self):
-        """
-        Displays the custom tooltip near the mouse cursor with audio information.
-        """
-        if self.current_hover_item_audio and self.current_hover_column_audio == COL_AUDIO:
-            audio_text = self.current_hover_item_audio.text(COL_AUDIO)
-            if audio_text:
-                self.audio_tooltip.setText(audio_text)
-                self.audio_tooltip.adjustSize()
-                # Position the tooltip slightly offset from the cursor
-                tooltip_x = self.last_hover_pos_audio.x() + 8
-                tooltip_y = self.last_hover_pos_audio.y() + 8
-                self.audio_tooltip.move(tooltip_x, tooltip_y)
-                self.audio_tooltip.setVisible(True)
-
-    def show_video_tooltip(self):
-        """
-        Displays the custom tooltip near the mouse cursor with video information.
-        """
-        if self.current_hover_item_video and self.current_hover_column_video == COL_VIDEO:
-            # Get the detailed video info from media_dict
-            media_dict = self.current_hover_item_video.media_dict
-            if media_dict:
-                video_info = media_dict['info'].get('video_info', '')
-                if video_info:
-                    self.video_tooltip.setText(video_info)
-                    self.video_tooltip.adjustSize()
-                    # Position the tooltip slightly offset from the cursor
-                    tooltip_x = self.last_hover_pos_video.x() + 8
-                    tooltip_y = self.last_hover_pos_video.y() + 8
-                    self.video_tooltip.move(tooltip_x, tooltip_y)
-                    self.video_tooltip.setVisible(True)
-
     def open_context_menu(self, position):
         # Create a context menu
         menu = QMenu(self)
@@ -1207,15 +1701,7 @@ class AudioSelectionDialog(QDialog):
             # It's a list of audio_tracks dictionaries (single file)
             for idx, track in enumerate(audio_tracks_or_labels, start=1):
                 # Handle Bitrate
-                bitrate = track.get('BitRate')
-                if bitrate and isinstance(bitrate, (int, float, str)) and str(bitrate).lower() != "n/a":
-                    try:
-                        bitrate_float = float(bitrate)
-                        bitrate_display = f"{int(bitrate_float / 1000)} kbps"
-                    except ValueError:
-                        bitrate_display = "Unknown Bitrate"
-                else:
-                    bitrate_display = "Unknown Bitrate"
+                bitrate_display = _format_bitrate(track.get('BitRate'))
 
                 # Retrieve and convert the Language using the shared function
                 language_str = track.get('Language/String') or track.get('Language') or "Unknown"
@@ -1243,6 +1729,11 @@ class AudioSelectionDialog(QDialog):
                 item.setCheckState(Qt.Checked)
                 self.list_widget.addItem(item)
 
+        # All items start checked; track check changes incrementally so
+        # retrieval does not have to query every item's state again
+        self._checked_indices = set(range(self.list_widget.count()))
+        self.list_widget.itemChanged.connect(self._on_item_changed)
+
         layout.addWidget(self.list_widget)
 
         buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
@@ -1252,13 +1743,15 @@ class AudioSelectionDialog(QDialog):
 
         self.setLayout(layout)
 
+    def _on_item_changed(self, item):
+        index = self.list_widget.row(item)
+        if item.checkState() == Qt.Checked:
+            self._checked_indices.add(index)
+        else:
+            self._checked_indices.discard(index)
+
     def get_selected_tracks(self):
-        selected = []
-        for index in range(self.list_widget.count()):
-            item = self.list_widget.item(index)
-            if item.checkState() == Qt.Checked:
-                selected.append(index)
-        return selected
+        return sorted(self._checked_indices)
 
 class QPushButtonWithToolTip(QPushButton):
     def event(self, e):
@@ -1270,6 +1763,17 @@ class QPushButtonWithToolTip(QPushButton):
         return super().event(e)
 
 class MediaEncoderGUI(QWidget):
+    # Hoisted SQL for the hot settings/column-width paths; a single string
+    # object per statement keeps sqlite3's statement cache hitting
+    _SQL_SAVE_SETTING = 'INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)'
+    _SQL_LOAD_SETTING = 'SELECT value FROM settings WHERE key = ?'
+    _SQL_SAVE_COLUMN_WIDTH = 'INSERT OR REPLACE INTO column_widths (column_index, width) VALUES (?, ?)'
+    _SQL_LOAD_COLUMN_WIDTHS = 'SELECT column_index, width FROM column_widths'
+
+    # Shared label pool for the audio-selection dialog; sliced instead of
+    # rebuilding identical "Track N" lists on every open
+    _TRACK_LABELS = tuple(f"Track {i+1}" for i in range(64))
+
     def __init__(self):
         super().__init__()
         self.media_files = []  # List to store media file paths and info
@@ -1279,7 +1783,21 @@ class MediaEncoderGUI(QWidget):
         self.selected_encoder = None  # Initialize selected encoder
         self.selected_audio_encoder = 'av_aac'  # Initialize with default value
         self.selected_priority = 'Normal'  # Initialize selected process priority
-        
+
+        # Track whether the temporary 'None' entry is present in the encoder
+        # combos so preset switches don't rescan the item lists
+        self._encoder_has_none = False
+        self._audio_encoder_has_none = False
+        self._last_recalc_hash = None  # Skips duplicate info-panel recomputes
+
+        # Memoized destination-folder check; only stat when the path changes
+        self._last_dest_path = None
+        self._last_dest_ok = False
+
+        # Running maximum of selected audio tracks across the media list,
+        # maintained on add/remove/selection edits so validation reads it O(1)
+        self._max_selected_audio_tracks = 0
+
         self.encoding_in_progress = False  # Add this line
 
         # Get script directory and set up dependencies path
@@ -1307,6 +1825,13 @@ class MediaEncoderGUI(QWidget):
         self.encoding_worker = None
         self.add_media_worker = None
 
+        # Thread pools the workers run on: metadata checks may fan out, while
+        # encodes are serialized (HandBrake saturates the machine by itself)
+        self.metadata_pool = QThreadPool(self)
+        self.metadata_pool.setMaxThreadCount(os.cpu_count() or 1)
+        self.encode_pool = QThreadPool(self)
+        self.encode_pool.setMaxThreadCount(1)
+
         # Initialize database
         self.db_path = os.path.join(self.dependencies_dir, 'settings.db')
         self.init_db()
@@ -1318,14 +1843,24 @@ class MediaEncoderGUI(QWidget):
         self.load_settings()
 
     def update_info_panel(self):
+        """
+        Schedule an info-panel refresh; bursts of changes coalesce into one
+        recompute via the single-shot debounce timer.
+        """
+        self._recalc_timer.start()
+
+    def _do_update_info_panel(self):
         """
         Update the calculated bitrate and estimated space saved in the info panel.
         """
         # Get selected items
         selected_items = self.media_list.selectedItems()
 
-        # If no files are selected, show N/A for both fields and return early
+        # If no files are selected, show N/A for both fields and return early.
+        # Every N/A path also drops the memo hash so the next valid input is
+        # never mistaken for the one that produced the N/A labels.
         if not selected_items:
+            self._last_recalc_hash = None
             self.calculated_bitrate_label.setText("Calculated Video Bitrate: N/A")
             self.space_saved_label.setText("Estimated Space Saved: N/A")
             return
@@ -1334,61 +1869,80 @@ class MediaEncoderGUI(QWidget):
         try:
             target_size_mb = float(self.target_size_input.text())
         except ValueError:
+            self._last_recalc_hash = None
             self.calculated_bitrate_label.setText("Calculated Video Bitrate: N/A")
             self.space_saved_label.setText("Estimated Space Saved: N/A")
             return
 
         # Use only the selected files for calculations
-        media_files_to_use = [item.media_dict for item in selected_items]
+        media_files_to_use = [item.data(0, Qt.UserRole) for item in selected_items]
+
+        # Identical inputs produce identical labels; Qt signal cascades often
+        # land here several times with nothing changed, so skip those
+        recalc_hash = hash((
+            self.target_size_input.text(),
+            self.audio_bitrate_input.text(),
+            self.audio_encoder_combo.currentText(),
+            tuple((media.get('path'), tuple(media.get('selected_audio_tracks', ())))
+                  for media in media_files_to_use),
+        ))
+        if recalc_hash == self._last_recalc_hash:
+            return
+        self._last_recalc_hash = recalc_hash
 
-        # Reset cumulative values for accurate calculations
-        total_duration = 0  # in seconds
-        total_input_size = 0  # in bytes
-        total_audio_bitrate_bps = 0  # in bits per second
-        total_video_bitrate_bps = 0  # in bits per second
+        infos = [media['info'] for media in media_files_to_use if media.get('info')]
 
         selected_audio_encoder = self.audio_encoder_combo.currentText()
 
-        for media in media_files_to_use:
-            # Get media info
-            media_info = media.get('info')
-
-            # Ensure media info is valid
-            if not media_info:
-                continue
+        durations = [info.duration_seconds for info in infos]
+        if any(duration is None for duration in durations):
+            self._last_recalc_hash = None
+            self.calculated_bitrate_label.setText("Calculated Video Bitrate: N/A")
+            self.space_saved_label.setText("Estimated Space Saved: N/A")
+            return
 
-            # Get file size in bytes
-            size_bytes = media_info.get('size_bytes', 0)
-            total_input_size += size_bytes
+        # Reduce sizes and durations in one pass each; with NumPy available the
+        # sums run at C speed over a flat float64 buffer
+        if np is not None:
+            total_input_size = float(np.fromiter((info.size_bytes for info in infos),
+                                                 dtype=np.float64, count=len(infos)).sum())
+            total_duration = float(np.fromiter(durations, dtype=np.float64,
+                                               count=len(durations)).sum())
+        else:
+            total_input_size = sum(info.size_bytes for info in infos)
+            total_duration = sum(durations)
 
-            # Get duration in seconds
-            duration_seconds = media_info.get('duration_seconds')
-            if duration_seconds is None:
+        total_audio_bitrate_bps = 0  # in bits per second
+        if selected_audio_encoder in _NO_AUDIO_BITRATE:
+            # Use the stored total audio bitrate from media_info if 'copy' or 'None'
+            if np is not None:
+                total_audio_bitrate_bps = float(np.fromiter(
+                    (info.total_audio_bitrate_kbps for info in infos),
+                    dtype=np.float64, count=len(infos)).sum()) * 1000
+            else:
+                total_audio_bitrate_bps = sum(info.total_audio_bitrate_kbps for info in infos) * 1000
+        elif self.audio_bitrate_input.text():
+            # Parse the bitrate CSV once instead of re-splitting it per media;
+            # the common single-value input skips the split entirely
+            txt = self.audio_bitrate_input.text()
+            try:
+                if ',' in txt:
+                    bitrate_floats = [float(bitrate.strip()) for bitrate in txt.split(',')]
+                else:
+                    bitrate_floats = [float(txt.strip())]
+            except ValueError:
                 self.calculated_bitrate_label.setText("Calculated Video Bitrate: N/A")
                 self.space_saved_label.setText("Estimated Space Saved: N/A")
                 return
-            total_duration += duration_seconds
-
-            # Handle audio bitrate
-            if selected_audio_encoder in ('copy', 'None'):
-                # Use the stored total audio bitrate from media_info if 'copy' or 'None'
-                media_audio_bitrate_kbps = media_info.get('total_audio_bitrate_kbps', 0)
-                total_audio_bitrate_bps += media_audio_bitrate_kbps * 1000  # Convert to bits per second
-            else:
+            for media in media_files_to_use:
+                if not media.get('info'):
+                    continue
                 # Calculate based on selected audio tracks
                 selected_audio_tracks = media.get('selected_audio_tracks', [])
-                if self.audio_bitrate_input.text():
-                    bitrate_values = [bitrate.strip() for bitrate in self.audio_bitrate_input.text().split(',')]
-                    # Sum bitrate for selected tracks
-                    if len(bitrate_values) == len(selected_audio_tracks):
-                        try:
-                            # Accumulate total audio bitrate for the selected tracks
-                            total_audio_bitrate_kbps = sum(float(bitrate_values[i]) for i in range(len(selected_audio_tracks)))
-                            total_audio_bitrate_bps += total_audio_bitrate_kbps * 1000  # Convert kbps to bps
-                        except ValueError:
-                            self.calculated_bitrate_label.setText("Calculated Video Bitrate: N/A")
-                            self.space_saved_label.setText("Estimated Space Saved: N/A")
-                            return
+                # Sum bitrate for selected tracks
+                if len(bitrate_floats) == len(selected_audio_tracks):
+                    # Accumulate total audio bitrate for the selected tracks
+                    total_audio_bitrate_bps += sum(bitrate_floats) * 1000  # Convert kbps to bps
 
         if total_duration <= 0:
             self.calculated_bitrate_label.setText("Calculated Video Bitrate: N/A")
@@ -1396,7 +1950,7 @@ class MediaEncoderGUI(QWidget):
             return
 
         # Calculate total target size in bits (for all selected files)
-        total_target_size_bits = target_size_mb * 8 * 1024 * 1024 * len(media_files_to_use)
+        total_target_size_bits = target_size_mb * BITS_PER_MB * len(media_files_to_use)
 
         # Total bitrate for all files (audio + video)
         total_bitrate_bps = total_target_size_bits / total_duration
@@ -1413,7 +1967,7 @@ class MediaEncoderGUI(QWidget):
             self.calculated_bitrate_label.setText(f"Calculated Video Bitrate: {int(video_bitrate_kbps)} kbps")
 
         # Calculate estimated space saved
-        total_input_size_mb = total_input_size / (1024 * 1024)
+        total_input_size_mb = total_input_size * INV_MB
         space_saved_mb = total_input_size_mb - target_size_mb * len(media_files_to_use)
         if total_input_size_mb > 0:
             percentage_saved = (space_saved_mb / total_input_size_mb) * 100
@@ -1424,37 +1978,52 @@ class MediaEncoderGUI(QWidget):
     def get_audio_bitrate(self, file_path):
         # Use MediaInfo to get audio bitrate in kbps
         try:
+            if _PyMediaInfo is not None:
+                # In-process probe via libmediainfo skips the per-file
+                # process spawn that dominates the CLI path
+                info = _PyMediaInfo.parse(file_path)
+                return int(sum(
+                    float(track.bit_rate) / 1000  # Convert bps to kbps
+                    for track in info.audio_tracks
+                    if track.bit_rate
+                ))
+            # Ask MediaInfo for just the audio BitRate fields via an --Inform
+            # template: a few bytes of output and no JSON document to parse
             output = subprocess.check_output(
-                [self.mediainfo_exe, '--Output=JSON', file_path],
-                encoding='utf-8',
-                errors='replace',
-                text=True
+                [self.mediainfo_exe, '--Inform=Audio;%BitRate%\\n', file_path],
+                creationflags=_NO_WINDOW
             )
-            data = json.loads(output)
-            tracks = data.get('media', {}).get('track', [])
-            audio_bitrate_total = 0
-            audio_tracks = [track for track in tracks if track.get('@type') == 'Audio']
-            for track in audio_tracks:
-                bitrate_str = track.get('BitRate')
-                if bitrate_str and str(bitrate_str).lower() != "n/a":
-                    audio_bitrate_total += float(bitrate_str) / 1000  # Convert bps to kbps
+            audio_bitrate_total = 0.0
+            for token in output.split():
+                try:
+                    audio_bitrate_total += float(token) / 1000  # Convert bps to kbps
+                except ValueError:
+                    pass  # Skip N/A and other non-numeric fields
             return int(audio_bitrate_total)
         except Exception as e:
             print(f"Error getting audio bitrate: {e}")
             return None
 
     def load_preset_files(self, folder_path):
-        preset_files = {}
-        for file_name in os.listdir(folder_path):
-            if file_name.endswith('.json'):
-                preset_name = os.path.splitext(file_name)[0]
-                preset_path = os.path.join(folder_path, file_name)
-                preset_files[preset_name] = preset_path
-        return preset_files
+        # scandir reuses the directory entry's cached type info instead of
+        # forcing a stat per name like listdir + isfile would
+        return {
+            os.path.splitext(entry.name)[0]: entry.path
+            for entry in os.scandir(folder_path)
+            if entry.is_file() and entry.name.endswith('.json')
+        }
 
     def init_db(self):
         # Initialize the database and create tables if not exists
-        self.conn = sqlite3.connect(self.db_path)
+        self.conn = sqlite3.connect(self.db_path, cached_statements=256)
+        # WAL with relaxed fsyncs keeps setting/column-width commits from
+        # stalling the UI thread on disk; temp tables and a larger page cache
+        # stay in memory
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute('PRAGMA temp_store=MEMORY')
+        self.conn.execute('PRAGMA cache_size=-8000')
+        self.conn.execute('PRAGMA busy_timeout=5000')
         self.cursor = self.conn.cursor()
         self.cursor.execute('''
             CREATE TABLE IF NOT EXISTS column_widths (
@@ -1468,34 +2037,71 @@ class MediaEncoderGUI(QWidget):
                 value TEXT
             )
         ''')
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS sample_size_cache (
+                hash TEXT,
+                encoder TEXT,
+                preset TEXT,
+                audio TEXT,
+                rf REAL,
+                size INTEGER,
+                PRIMARY KEY (hash, encoder, preset, audio, rf)
+            )
+        ''')
         self.conn.commit()
 
+        # Separate read-only connection: under WAL the loads never wait on a
+        # write commit in flight, and worker threads may share it safely
+        self.conn_ro = sqlite3.connect(
+            f'file:{self.db_path}?mode=ro', uri=True, check_same_thread=False
+        )
+
+        # Write-through settings cache: reads are dict lookups and writes
+        # only touch the database when the value actually changed
+        self._settings_cache = self.load_all_settings()
+
     def save_setting(self, key, value):
-        # Save a setting to the database
-        self.cursor.execute('''
-            INSERT OR REPLACE INTO settings (key, value)
-            VALUES (?, ?)
-        ''', (key, value))
+        # Skip the write entirely when nothing changed
+        if self._settings_cache.get(key) == value:
+            return
+        self._settings_cache[key] = value
+        self.cursor.execute(self._SQL_SAVE_SETTING, (key, value))
         self.conn.commit()
 
+    def save_settings_bulk(self, settings):
+        # Persist many settings in one transaction (a single fsync)
+        changed = {key: value for key, value in settings.items()
+                   if self._settings_cache.get(key) != value}
+        if not changed:
+            return
+        self._settings_cache.update(changed)
+        with self.conn:
+            self.conn.executemany(self._SQL_SAVE_SETTING, list(changed.items()))
+
     def load_setting(self, key, default=None):
-        # Load a setting from the database
-        self.cursor.execute('SELECT value FROM settings WHERE key = ?', (key,))
-        result = self.cursor.fetchone()
-        return result[0] if result else default
+        # Read from the in-memory cache
+        return self._settings_cache.get(key, default)
+
+    def load_all_settings(self):
+        # Fetch the whole settings table in one query
+        return dict(self.conn_ro.execute('SELECT key, value FROM settings').fetchall())
 
     def save_column_width(self, column_index, width):
-        # Save the width of a column to the database
-        self.cursor.execute('''
-            INSERT OR REPLACE INTO column_widths (column_index, width)
-            VALUES (?, ?)
-        ''', (column_index, width))
-        self.conn.commit()
+        # Buffer the width; the debounce timer flushes the burst in one commit
+        self._pending_widths[column_index] = width
+        self._width_flush_timer.start()
+
+    def _flush_column_widths(self):
+        # Write all buffered column widths in a single transaction
+        if not self._pending_widths:
+            return
+        with self.conn:
+            self.conn.executemany(self._SQL_SAVE_COLUMN_WIDTH, list(self._pending_widths.items()))
+        self._pending_widths.clear()
 
     def load_column_widths(self):
-        # Load column widths from the database
-        self.cursor.execute('SELECT column_index, width FROM column_widths')
-        rows = self.cursor.fetchall()
+        # Load column widths via the read-only connection
+        rows = self.conn_ro.execute(self._SQL_LOAD_COLUMN_WIDTHS).fetchall()
         widths = {col_index: width for col_index, width in rows}
         # Set column widths
         for col_index in [COL_FILENAME, COL_DURATION, COL_VIDEO, COL_AUDIO, COL_SIZE]:
@@ -1513,11 +2119,9 @@ class MediaEncoderGUI(QWidget):
         Returns:
             QLabel: A styled QLabel widget.
         """
-        font = QFont()
-        font.setPointSizeF(headline_config.get('font_size', 12))
-        font.setBold(headline_config.get('bold', True))
         label = QLabel(headline_config.get('text', ''))
-        label.setFont(font)
+        label.setFont(_font(headline_config.get('font_size', 12),
+                            headline_config.get('bold', True)))
         label.setStyleSheet(f"color: {headline_config.get('color', '#000000')};")
         return label
 
@@ -1528,6 +2132,38 @@ class MediaEncoderGUI(QWidget):
             self.setWindowIcon(QIcon(self.icon_path))  # Set the window icon
         self.setAcceptDrops(True)  # Enable drag-and-drop
 
+        # Debounce for the info-panel recompute: typing a number or sweeping a
+        # selection fires on_settings_changed per keystroke/item, so only the
+        # last change in a burst actually recalculates
+        self._recalc_timer = QTimer(self)
+        self._recalc_timer.setSingleShot(True)
+        self._recalc_timer.setInterval(150)
+        self._recalc_timer.timeout.connect(self._do_update_info_panel)
+
+        # Column-width saves are buffered here and flushed in one transaction;
+        # a header drag otherwise commits once per pixel of resize
+        self._pending_widths = {}
+        self._width_flush_timer = QTimer(self)
+        self._width_flush_timer.setSingleShot(True)
+        self._width_flush_timer.setInterval(300)
+        self._width_flush_timer.timeout.connect(self._flush_column_widths)
+
+        # Same treatment for the settings-changed validation pass, which every
+        # widget change funnels into
+        self._settings_timer = QTimer(self)
+        self._settings_timer.setSingleShot(True)
+        self._settings_timer.setInterval(150)
+        self._settings_timer.timeout.connect(self._do_settings_changed)
+
+        # Progress/output lines buffer here and flush to the text panes at
+        # 20 Hz; HandBrake can emit far more lines per second than that
+        self._progress_buf = []
+        self._output_buf = []
+        self._stream_flush_timer = QTimer(self)
+        self._stream_flush_timer.setInterval(50)
+        self._stream_flush_timer.timeout.connect(self._flush_stream_buffers)
+        self._stream_flush_timer.start()
+
         # Only set the default size if window size was not loaded
         if not getattr(self, 'window_size_loaded', False):
             self.resize(MEDIA_LIST_WIDTH, MEDIA_LIST_HEIGHT + PROGRESS_AREA_HEIGHT + OUTPUT_AREA_HEIGHT + 300)
@@ -1547,9 +2183,7 @@ class MediaEncoderGUI(QWidget):
         dest_layout = QHBoxLayout()
         self.dest_input = QLineEdit()
         self.dest_input.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
-        dest_input_font = self.dest_input.font()
-        dest_input_font.setPointSizeF(FONT_SIZE_DEST_INPUT)
-        self.dest_input.setFont(dest_input_font)
+        self.dest_input.setFont(_font(FONT_SIZE_DEST_INPUT))
         self.dest_browse_btn = QPushButton('Browse...')
         self.dest_browse_btn.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Preferred)
         dest_layout.addWidget(self.dest_input)
@@ -1568,9 +2202,7 @@ class MediaEncoderGUI(QWidget):
 
         # Media List
         self.media_list = MediaListWidget()
-        media_list_font = self.media_list.font()
-        media_list_font.setPointSizeF(FONT_SIZE_MEDIA_LIST)
-        self.media_list.setFont(media_list_font)
+        self.media_list.setFont(_font(FONT_SIZE_MEDIA_LIST))
         self.media_list.setHeaderLabels(["Filename", "Duration", "Video", "Audio", "Size"])
         self.media_list.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         # Remove indentation to align filename to the left
@@ -1646,10 +2278,8 @@ class MediaEncoderGUI(QWidget):
         info_panel_layout.setAlignment(Qt.AlignCenter)  # Center the info panel
 
         # Set Font Size for Info Panel Labels
-        info_panel_font = QFont()
-        info_panel_font.setPointSizeF(FONT_SIZE_INFO_PANEL)  # Changed to setPointSizeF
-        self.calculated_bitrate_label.setFont(info_panel_font)
-        self.space_saved_label.setFont(info_panel_font)
+        self.calculated_bitrate_label.setFont(_font(FONT_SIZE_INFO_PANEL))
+        self.space_saved_label.setFont(_font(FONT_SIZE_INFO_PANEL))
 
         info_panel_widget = QWidget()
         info_panel_widget.setLayout(info_panel_layout)
@@ -1661,7 +2291,7 @@ class MediaEncoderGUI(QWidget):
 
         self.preset_combo = QComboBox()
         self.preset_combo.addItem('None')  # Add 'None' option at the top
-        self.preset_combo.addItems(sorted(self.preset_files.keys()))
+        self.preset_combo.addItems(sorted(self.preset_files))
         # Set tooltip to inform about 'None' option
         self.preset_combo.setToolTip(
             "Select a preset for encoding. Choose 'None' to proceed without a preset."
@@ -1669,9 +2299,7 @@ class MediaEncoderGUI(QWidget):
         # Set width, height, and font size for the preset combo box
         self.preset_combo.setFixedWidth(COMBO_BOX_WIDTH)
         self.preset_combo.setFixedHeight(COMBO_BOX_HEIGHT)
-        combo_box_font = self.preset_combo.font()
-        combo_box_font.setPointSizeF(FONT_SIZE_COMBO_BOX)
-        self.preset_combo.setFont(combo_box_font)
+        self.preset_combo.setFont(_font(FONT_SIZE_COMBO_BOX))
         settings_layout.addWidget(self.preset_combo, 0, 4)
 
         # Adjust column stretch
@@ -1715,9 +2343,7 @@ class MediaEncoderGUI(QWidget):
             "'ask' to prompt for confirmation, or 'no' to keep source files."
         )
         # Set font size and dimensions for the delete source combo box
-        combo_box_font = self.delete_source_combo.font()
-        combo_box_font.setPointSizeF(FONT_SIZE_COMBO_BOX)
-        self.delete_source_combo.setFont(combo_box_font)
+        self.delete_source_combo.setFont(_font(FONT_SIZE_COMBO_BOX))
         self.delete_source_combo.setFixedWidth(COMBO_BOX_WIDTH)
         self.delete_source_combo.setFixedHeight(COMBO_BOX_HEIGHT)
         left_combo_layout.addWidget(delete_source_label)
@@ -1739,7 +2365,7 @@ class MediaEncoderGUI(QWidget):
             "Set the process priority for encoding. 'Normal' is default, 'Below Normal' and 'Low' decrease the priority."
         )
         # Set font size and dimensions for the priority combo box
-        self.priority_combo.setFont(combo_box_font)
+        self.priority_combo.setFont(_font(FONT_SIZE_COMBO_BOX))
         self.priority_combo.setFixedWidth(COMBO_BOX_WIDTH)
         self.priority_combo.setFixedHeight(COMBO_BOX_HEIGHT)
         left_combo_layout.addWidget(priority_label)
@@ -1781,9 +2407,7 @@ class MediaEncoderGUI(QWidget):
         self.encoder_combo.setCurrentText('x265')
 
         # Set font size and dimensions for the encoder combo box
-        encoder_combo_box_font = self.encoder_combo.font()
-        encoder_combo_box_font.setPointSizeF(FONT_SIZE_COMBO_BOX)
-        self.encoder_combo.setFont(encoder_combo_box_font)
+        self.encoder_combo.setFont(_font(FONT_SIZE_COMBO_BOX))
         self.encoder_combo.setFixedWidth(COMBO_BOX_WIDTH)
         self.encoder_combo.setFixedHeight(COMBO_BOX_HEIGHT)
 
@@ -1813,9 +2437,7 @@ class MediaEncoderGUI(QWidget):
         self.audio_encoder_combo.setCurrentText('av_aac')
 
         # Set font size and dimensions for the audio encoder combo box
-        audio_combo_box_font = self.audio_encoder_combo.font()
-        audio_combo_box_font.setPointSizeF(FONT_SIZE_COMBO_BOX)
-        self.audio_encoder_combo.setFont(audio_combo_box_font)
+        self.audio_encoder_combo.setFont(_font(FONT_SIZE_COMBO_BOX))
         self.audio_encoder_combo.setFixedWidth(COMBO_BOX_WIDTH)
         self.audio_encoder_combo.setFixedHeight(COMBO_BOX_HEIGHT)
 
@@ -1837,10 +2459,11 @@ class MediaEncoderGUI(QWidget):
         progress_section.addWidget(progress_headline)
 
         # Progress Area
-        self.progress_area = QTextEdit()
-        progress_area_font = self.progress_area.font()
-        progress_area_font.setPointSizeF(FONT_SIZE_PROGRESS_AREA)
-        self.progress_area.setFont(progress_area_font)
+        # Plain-text widget: appends stay O(1) instead of re-laying out a
+        # rich-text document, and the block cap bounds memory on long runs
+        self.progress_area = QPlainTextEdit()
+        self.progress_area.setMaximumBlockCount(500)
+        self.progress_area.setFont(_font(FONT_SIZE_PROGRESS_AREA))
         self.progress_area.setReadOnly(True)
         self.progress_area.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         progress_section.addWidget(self.progress_area)
@@ -1855,10 +2478,9 @@ class MediaEncoderGUI(QWidget):
         output_section.addWidget(output_headline)
 
         # Output Area (HandBrakeCLI Output)
-        self.output_area = QTextEdit()
-        output_area_font = self.output_area.font()
-        output_area_font.setPointSizeF(FONT_SIZE_OUTPUT_AREA)
-        self.output_area.setFont(output_area_font)
+        self.output_area = QPlainTextEdit()
+        self.output_area.setMaximumBlockCount(2000)
+        self.output_area.setFont(_font(FONT_SIZE_OUTPUT_AREA))
         self.output_area.setReadOnly(True)
         self.output_area.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         output_section.addWidget(self.output_area)
@@ -1868,9 +2490,7 @@ class MediaEncoderGUI(QWidget):
 
         # Current File Label
         self.current_file_label = QLabel("Current File: None")
-        current_file_font = self.current_file_label.font()
-        current_file_font.setPointSizeF(FONT_SIZE_LABELS)
-        self.current_file_label.setFont(current_file_font)
+        self.current_file_label.setFont(_font(FONT_SIZE_LABELS))
         self.current_file_label.setStyleSheet("color: #000000;")
         self.current_file_label.setVisible(False)
         progress_info_layout.addWidget(self.current_file_label)
@@ -1979,21 +2599,23 @@ class MediaEncoderGUI(QWidget):
         self.selected_preset = self.preset_combo.currentText()
         if self.selected_preset != 'None':
             # Ensure 'None' is in the encoder combos
-            if 'None' not in [self.encoder_combo.itemText(i) for i in range(self.encoder_combo.count())]:
-                self.encoder_combo.insertItem(0, 'None')
-            if 'None' not in [self.audio_encoder_combo.itemText(i) for i in range(self.audio_encoder_combo.count())]:
-                self.audio_encoder_combo.insertItem(0, 'None')
+            if not self._encoder_has_none:
+                self.encoder_combo.insertItems(0, ['None'])
+                self._encoder_has_none = True
+            if not self._audio_encoder_has_none:
+                self.audio_encoder_combo.insertItems(0, ['None'])
+                self._audio_encoder_has_none = True
             # Set current selection to 'None'
             self.encoder_combo.setCurrentText('None')
             self.audio_encoder_combo.setCurrentText('None')
         else:
             # Remove 'None' from encoder combos if present
-            index = self.encoder_combo.findText('None')
-            if index != -1:
-                self.encoder_combo.removeItem(index)
-            index = self.audio_encoder_combo.findText('None')
-            if index != -1:
-                self.audio_encoder_combo.removeItem(index)
+            if self._encoder_has_none:
+                self.encoder_combo.removeItem(self.encoder_combo.findText('None'))
+                self._encoder_has_none = False
+            if self._audio_encoder_has_none:
+                self.audio_encoder_combo.removeItem(self.audio_encoder_combo.findText('None'))
+                self._audio_encoder_has_none = False
             # Set encoder selections to default values if necessary
             if self.encoder_combo.currentIndex() == -1:
                 self.encoder_combo.setCurrentIndex(0)
@@ -2017,15 +2639,19 @@ class MediaEncoderGUI(QWidget):
         self.update_multi_pass_state()
         self.on_settings_changed()
 
-    def on_audio_encoder_changed(self):
-        self.selected_audio_encoder = self.audio_encoder_combo.currentText()
-        self.save_setting('selected_audio_encoder', self.selected_audio_encoder)
+    def _sync_audio_bitrate_enabled(self, clear=False):
         # Disable the audio bitrate input if 'copy' or 'None' is selected
-        if self.selected_audio_encoder in ('copy', 'None'):
+        if self.selected_audio_encoder in _NO_AUDIO_BITRATE:
             self.audio_bitrate_input.setEnabled(False)
-            self.audio_bitrate_input.clear()  # Clear the input field
+            if clear:
+                self.audio_bitrate_input.clear()  # Clear the input field
         else:
             self.audio_bitrate_input.setEnabled(True)
+
+    def on_audio_encoder_changed(self):
+        self.selected_audio_encoder = self.audio_encoder_combo.currentText()
+        self.save_setting('selected_audio_encoder', self.selected_audio_encoder)
+        self._sync_audio_bitrate_enabled(clear=True)
         self.on_settings_changed()
 
     def on_priority_changed(self):
@@ -2048,16 +2674,19 @@ class MediaEncoderGUI(QWidget):
         self.on_settings_changed()
 
     def load_settings(self):
+        # One query for the whole settings table instead of a round-trip per key
+        settings = self.load_all_settings()
+
         # Load destination folder from the database
-        self.destination_folder = self.load_setting('destination_folder', '')
+        self.destination_folder = settings.get('destination_folder', '')
         self.dest_input.setText(self.destination_folder)
 
         # Load column widths
         self.load_column_widths()
 
         # Load window size
-        window_width = self.load_setting('window_width')
-        window_height = self.load_setting('window_height')
+        window_width = settings.get('window_width')
+        window_height = settings.get('window_height')
         self.window_size_loaded = False  # Initialize flag
         if window_width and window_height:
             try:
@@ -2069,8 +2698,8 @@ class MediaEncoderGUI(QWidget):
                 pass  # Use default size if values are invalid
 
         # Load window position
-        window_x = self.load_setting('window_x')
-        window_y = self.load_setting('window_y')
+        window_x = settings.get('window_x')
+        window_y = settings.get('window_y')
         if window_x and window_y:
             try:
                 window_x = int(window_x)
@@ -2080,7 +2709,7 @@ class MediaEncoderGUI(QWidget):
                 pass  # Use default position if values are invalid
 
         # Load delete source files setting
-        delete_source_files = self.load_setting('delete_source_files', 'no')  # Default to 'no'
+        delete_source_files = settings.get('delete_source_files', 'no')  # Default to 'no'
         delete_source_files_capitalized = delete_source_files.capitalize()  # Capitalize the first letter
         index = self.delete_source_combo.findText(delete_source_files_capitalized)
         if index != -1:
@@ -2089,7 +2718,7 @@ class MediaEncoderGUI(QWidget):
             self.delete_source_combo.setCurrentIndex(2)  # Default to 'No' if not found
 
         # Load selected encoder
-        self.selected_encoder = self.load_setting('selected_encoder', 'x265')
+        self.selected_encoder = settings.get('selected_encoder', 'x265')
         index = self.encoder_combo.findText(self.selected_encoder)
         if index != -1:
             self.encoder_combo.setCurrentIndex(index)
@@ -2097,7 +2726,7 @@ class MediaEncoderGUI(QWidget):
             self.encoder_combo.setCurrentIndex(0)  # Default to first encoder if not found
 
         # Load selected audio encoder
-        self.selected_audio_encoder = self.load_setting('selected_audio_encoder', 'av_aac')
+        self.selected_audio_encoder = settings.get('selected_audio_encoder', 'av_aac')
         index = self.audio_encoder_combo.findText(self.selected_audio_encoder)
         if index != -1:
             self.audio_encoder_combo.setCurrentIndex(index)
@@ -2105,13 +2734,10 @@ class MediaEncoderGUI(QWidget):
             self.audio_encoder_combo.setCurrentIndex(0)  # Default to first audio encoder if not found
 
         # Disable audio bitrate input if 'copy' or 'None' is selected
-        if self.selected_audio_encoder in ('copy', 'None'):
-            self.audio_bitrate_input.setEnabled(False)
-        else:
-            self.audio_bitrate_input.setEnabled(True)
+        self._sync_audio_bitrate_enabled()
 
         # Load selected preset
-        self.selected_preset = self.load_setting('selected_preset', 'None')
+        self.selected_preset = settings.get('selected_preset', 'None')
         index = self.preset_combo.findText(self.selected_preset)
         if index != -1:
             self.preset_combo.setCurrentIndex(index)
@@ -2119,7 +2745,7 @@ class MediaEncoderGUI(QWidget):
             self.preset_combo.setCurrentIndex(0)  # Default to 'None' if not found
 
         # Load selected process priority
-        self.selected_priority = self.load_setting('selected_priority', 'Normal')
+        self.selected_priority = settings.get('selected_priority', 'Normal')
         index = self.priority_combo.findText(self.selected_priority)
         if index != -1:
             self.priority_combo.setCurrentIndex(index)
@@ -2127,11 +2753,9 @@ class MediaEncoderGUI(QWidget):
             self.priority_combo.setCurrentIndex(0)  # Default to 'Normal' if not found
 
         # Disable or enable audio bitrate input based on selected audio encoder
-        if self.selected_audio_encoder in ('copy', 'None'):
-            self.audio_bitrate_input.setEnabled(False)
-        else:
-            self.audio_bitrate_input.setEnabled(True)
-            
+        self._sync_audio_bitrate_enabled()
+
+
         # Set Multi-Pass checkbox to unchecked by default
         self.multi_pass_checkbox.setChecked(False)
         # Update Multi-Pass state based on current settings
@@ -2142,39 +2766,83 @@ class MediaEncoderGUI(QWidget):
             event.acceptProposedAction()
 
     def dropEvent(self, event):
+        # Filter to media files here so the worker never iterates over the
+        # other contents of a dropped folder
         file_paths = []
+        known_sizes = {}
         for url in event.mimeData().urls():
             path = url.toLocalFile()
             if os.path.isdir(path):
-                for root, dirs, files in os.walk(path):
-                    for file in files:
-                        file_paths.append(os.path.join(root, file))
-            else:
+                # Iterative scandir walk: DirEntry carries the joined path and
+                # cached type info, avoiding os.walk's extra stats and joins
+                stack = [path]
+                while stack:
+                    try:
+                        entries = os.scandir(stack.pop())
+                    except OSError:
+                        # Unlistable directory (permissions, recycle bin on a
+                        # dropped drive root): skip it like os.walk used to
+                        continue
+                    with entries:
+                        for entry in entries:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                            elif (entry.is_file(follow_symlinks=False)
+                                  and os.path.splitext(entry.name)[1].lower() in _MEDIA_EXTS):
+                                file_paths.append(entry.path)
+                                known_sizes[entry.path] = entry.stat(follow_symlinks=False).st_size
+            elif os.path.splitext(path)[1].lower() in _MEDIA_EXTS:
                 file_paths.append(path)
-        self.add_media_worker = AddMediaWorker(file_paths, self.mediainfo_exe)
+        self.add_media_worker = AddMediaWorker(file_paths, self.mediainfo_exe,
+                                               known_sizes=known_sizes)
         self.add_media_worker.progress.connect(self.add_media_files_incrementally)  # Use incremental update
         self.add_media_worker.finished.connect(self.on_add_media_finished)
         self.add_media_worker.start()
         self.on_settings_changed()
 
+    def _bulk_add_media(self, items):
+        # Insert many rows at once with sorting and repaints suspended; with
+        # sorting live, every insert re-sorts the whole tree
+        self.media_list.setSortingEnabled(False)
+        self.media_list.setUpdatesEnabled(False)
+        self.media_list.blockSignals(True)
+        try:
+            self.media_list.addTopLevelItems(items)
+        finally:
+            self.media_list.blockSignals(False)
+            self.media_list.setUpdatesEnabled(True)
+            self.media_list.setSortingEnabled(True)
+
     def add_media_files_incrementally(self, media_files):
+        new_items = []
         for media_info in media_files:
             display_info = [
-                media_info['filename'],
-                media_info['duration'],
-                media_info['video'],
-                media_info['audio'],
-                media_info['size']
+                media_info.filename,
+                media_info.duration,
+                media_info.video,
+                media_info.audio,
+                media_info.size
             ]
             item = QTreeWidgetItem(display_info)
-            media = {'path': media_info['path'], 'info': media_info, 'item': item}
-            
+            item.setToolTip(COL_AUDIO, media_info.audio)
+            item.setToolTip(COL_VIDEO, media_info.video_info)
+            media = {'path': media_info.path, 'info': media_info, 'item': item}
+            try:
+                # Remembered so refresh_media_info can skip unchanged files
+                media['mtime'] = os.path.getmtime(media_info.path)
+            except OSError:
+                media['mtime'] = None
+
             # Select all audio tracks by default
-            media['selected_audio_tracks'] = list(range(len(media_info['audio_tracks'])))  # All tracks selected by default
-            item.media_dict = media  # Attach media dict to the item
+            media['selected_audio_tracks'] = list(range(len(media_info.audio_tracks)))  # All tracks selected by default
+            self._max_selected_audio_tracks = max(self._max_selected_audio_tracks,
+                                                  len(media_info.audio_tracks))
+            item.setData(0, Qt.UserRole, media)  # Attach media dict to the item
             
             self.media_files.append(media)
-            self.media_list.addTopLevelItem(item)
+            new_items.append(item)
+        self._bulk_add_media(new_items)
+        self._last_recalc_hash = None  # The selection's composition changed
 
         # Automatically select the topmost item in the media list
         if self.media_list.topLevelItemCount() > 0:
@@ -2188,7 +2856,11 @@ class MediaEncoderGUI(QWidget):
         self.on_settings_changed()
 
     def check_media(self):
+        # Apply any edit still sitting in the settings debounce window
+        self._flush_settings_changed()
+
         # Clear progress area
+        self._progress_buf.clear()
         self.progress_area.clear()
 
         # Disable buttons during processing
@@ -2203,10 +2875,11 @@ class MediaEncoderGUI(QWidget):
             self.mkvpropedit_exe,
             per_file_output_only=PER_FILE_OUTPUT_ONLY  # Add this line
         )
+        self.check_media_worker.mi_cache_db_path = self.db_path  # Enable the persistent probe cache
         self.check_media_worker.progress.connect(self.update_progress)
         self.check_media_worker.clear_progress.connect(self.clear_progress_areas)
         self.check_media_worker.finished.connect(self.check_media_finished)
-        self.check_media_worker.start()
+        self.metadata_pool.start(self.check_media_worker)
 
     def check_media_finished(self):
         # Refresh media info to reflect updates
@@ -2217,40 +2890,61 @@ class MediaEncoderGUI(QWidget):
 
     def refresh_media_info(self):
         """
-        Refresh the media information displayed in the GUI.
+        Refresh the media information displayed in the GUI. Only files whose
+        mtime changed since they were probed are re-probed (on the add-media
+        worker thread); their rows are updated in place.
         """
-        self.media_list.clear()
-        updated_media_files = []
+        stale = []
         for media in self.media_files:
-            file_path = media['path']
-            media_info = self.get_media_info(file_path)
-            if media_info:
-                display_info = [
-                    media_info['filename'],
-                    media_info['duration'],
-                    media_info['video'],
-                    media_info['audio'],
-                    media_info['size']
-                ]
-            else:
-                display_info = [os.path.basename(file_path), "Error getting info", "", "", ""]
-            item = QTreeWidgetItem(display_info)
-            media = {'path': file_path, 'info': media_info, 'item': item}
-            media['selected_audio_tracks'] = list(range(len(media_info['audio_tracks']))) if media_info and 'audio_tracks' in media_info else []
-            item.media_dict = media
-            updated_media_files.append(media)
-            self.media_list.addTopLevelItem(item)
-        self.media_files = updated_media_files
+            try:
+                mtime = os.path.getmtime(media['path'])
+            except OSError:
+                continue
+            if media.get('mtime') == mtime and media.get('info'):
+                continue
+            media['mtime'] = mtime
+            stale.append(media)
+        if not stale:
+            return
+        self._refresh_lookup = {media['path']: media for media in stale}
+        self.add_media_worker = AddMediaWorker([media['path'] for media in stale],
+                                               self.mediainfo_exe)
+        self.add_media_worker.progress.connect(self._update_media_rows)
+        self.add_media_worker.finished.connect(self.on_add_media_finished)
+        self.add_media_worker.start()
+
+    def _update_media_rows(self, media_files):
+        # Apply re-probed info to the existing rows instead of rebuilding the tree
+        for media_info in media_files:
+            media = self._refresh_lookup.get(media_info.path)
+            if media is None:
+                continue
+            media['info'] = media_info
+            media['selected_audio_tracks'] = list(range(len(media_info.audio_tracks)))
+            item = media['item']
+            item.setText(COL_FILENAME, media_info.filename)
+            item.setText(COL_DURATION, media_info.duration)
+            item.setText(COL_VIDEO, media_info.video)
+            item.setText(COL_AUDIO, media_info.audio)
+            item.setText(COL_SIZE, media_info.size)
+            item.setToolTip(COL_AUDIO, media_info.audio)
+            item.setToolTip(COL_VIDEO, media_info.video_info)
+        self._last_recalc_hash = None  # Media info changed under the same ids
+        self._recompute_max_selected_tracks()
+        self.update_info_panel()
+
+    def _recompute_max_selected_tracks(self):
+        self._max_selected_audio_tracks = max(
+            (len(media.get('selected_audio_tracks', [])) for media in self.media_files),
+            default=0)
 
     def get_media_info(self, file_path):
         try:
             output = subprocess.check_output(
                 [self.mediainfo_exe, '--Output=JSON', file_path],
-                encoding='utf-8',
-                errors='replace',
-                text=True
+                creationflags=_NO_WINDOW
             )
-            data = json.loads(output)
+            data = _json_loads(output)
             tracks = data.get('media', {}).get('track', [])
 
             # Initialize variables
@@ -2279,13 +2973,7 @@ class MediaEncoderGUI(QWidget):
 
             file_size = os.path.getsize(file_path)
 
-            # Define a function to format bitrate with '.' as thousands separator
-            def format_bitrate_kbps(value):
-                s = f"{value:,.0f}"  # Format with ',' as thousands separator
-                return s.replace(',', '.')
-
             # Video bitrate formatting with enhanced handling
-            video_info_list = []
             if video_track:
                 # Collect video details
                 video_codec = video_track.get('Format', 'Unknown')
@@ -2294,26 +2982,17 @@ class MediaEncoderGUI(QWidget):
                 if video_bitrate and str(video_bitrate).lower() != "n/a":
                     try:
                         video_bitrate_float = float(video_bitrate) / 1000  # Convert to kbps
-                        video_bitrate_formatted = format_bitrate_kbps(video_bitrate_float)
+                        video_bitrate_formatted = _format_bitrate_kbps(video_bitrate_float)
                     except ValueError:
                         pass
 
-                # Resolution
-                width = video_track.get('Width', 'Unknown')
-                height = video_track.get('Height', 'Unknown')
-                resolution = f"{width}x{height}"
-
-                # Frame rate
-                frame_rate = video_track.get('FrameRate', 'Unknown')
-
-                # Build video info list
-                video_info_list.append(f"Codec: {video_codec}")
-                video_info_list.append(f"Bitrate: {video_bitrate_formatted} kbps")
-                video_info_list.append(f"Resolution: {resolution}")
-                video_info_list.append(f"Frame Rate: {frame_rate} fps")
-
-                # Combine into multi-line string
-                video_info = "\n".join(video_info_list)
+                # Build the multi-line tooltip string in one join
+                video_info = "\n".join((
+                    f"Codec: {video_codec}",
+                    f"Bitrate: {video_bitrate_formatted} kbps",
+                    f"Resolution: {video_track.get('Width', 'Unknown')}x{video_track.get('Height', 'Unknown')}",
+                    f"Frame Rate: {video_track.get('FrameRate', 'Unknown')} fps",
+                ))
                 # For display in the column, use a summary
                 video_summary = f"{video_codec} {video_bitrate_formatted} kbps"
             else:
@@ -2323,33 +3002,24 @@ class MediaEncoderGUI(QWidget):
             # Audio bitrate and language formatting
             audio_info_list = []
             for idx, audio_track in enumerate(audio_tracks, start=1):
+                audio_codec = audio_track.get('Format', 'Unknown')
                 bitrate_str = audio_track.get('BitRate')
                 language_str = audio_track.get('Language/String') or audio_track.get('Language') or "Unknown"
                 # Convert language codes to full names using the shared function
                 full_language = get_full_language_name(language_str)
                 if isinstance(full_language, list):
                     full_language = ', '.join(full_language)
-                if bitrate_str and isinstance(bitrate_str, (int, float, str)) and str(bitrate_str).lower() != "n/a":
-                    try:
-                        bitrate_float = float(bitrate_str) / 1000  # Convert to kbps
-                        audio_codec = audio_track.get('Format', 'Unknown')
-                        bitrate_display = f"{int(bitrate_float)} kbps" if bitrate_float else "Unknown Bitrate"
-                    except ValueError:
-                        bitrate_display = "Unknown Bitrate"
-                else:
-                    bitrate_display = "Unknown Bitrate"
-
-                # Retrieve the Title if available
-                title = audio_track.get('Title', '').strip()
+                bitrate_display = _format_bitrate(bitrate_str)
 
-                if title:
-                    # Include the Title in the display if it exists
-                    audio_info = f"{idx}: {title} - {audio_track.get('Format', 'Unknown')} {bitrate_display} [{full_language}]"
-                else:
-                    # Fallback to original format if Title is not available
-                    audio_info = f"{idx}: {audio_track.get('Format', 'Unknown')} {bitrate_display} [{full_language}]"
+                # Cache the codec/bitrate display on the track so the
+                # audio-selection accept path can reuse it instead of
+                # re-parsing BitRate for every selected row
+                audio_track['_display'] = f"{audio_codec} {bitrate_display}"
 
-                audio_info_list.append(audio_info)
+                # Include the Title in the display if it exists
+                title = audio_track.get('Title', '').strip()
+                title_part = f"{title} - " if title else ""
+                audio_info_list.append(f"{idx}: {title_part}{audio_codec} {bitrate_display} [{full_language}]")
 
             audio_info = "\n".join(audio_info_list)
 
@@ -2367,33 +3037,33 @@ class MediaEncoderGUI(QWidget):
                     duration_seconds = None
 
             # Return info as a dict
-            info = {
-                'filename': os.path.basename(file_path),
-                'duration': duration_formatted,
-                'duration_seconds': duration_seconds,
-                'video': video_summary,      # Display summary in the column
-                'video_info': video_info,    # Store detailed info for tooltip
-                'audio': audio_info,
-                'size': f"{int(file_size / (1024 * 1024))} MB",
-                'size_bytes': file_size,
-                'total_audio_bitrate_kbps': total_audio_bitrate_kbps,  # Store total audio bitrate
-                'path': file_path,
-                'audio_tracks': audio_tracks  # Store all audio tracks for selection
-            }
-            return info
+            return MediaInfo(
+                filename=os.path.basename(file_path),
+                duration=duration_formatted,
+                duration_seconds=duration_seconds,
+                video=video_summary,         # Display summary in the column
+                video_info=video_info,       # Store detailed info for tooltip
+                audio=audio_info,
+                size=f"{int(file_size / (1024 * 1024))} MB",
+                size_bytes=file_size,
+                total_audio_bitrate_kbps=total_audio_bitrate_kbps,
+                path=file_path,
+                audio_tracks=audio_tracks    # Store all audio tracks for selection
+            )
         except Exception as e:
             self.update_progress(f"Error getting media info for {file_path}: {e}")
             return None
 
     def format_duration(self, seconds):
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        return f"{hours}h:{minutes}min"
+        hours, rem = divmod(int(seconds), 3600)
+        return f"{hours}h:{rem // 60}min"
 
     def start_encoding(self):
-        # Clear output area
-        self.output_area.clear()
-        self.progress_area.clear()
+        # Apply any edit still sitting in the settings debounce window
+        self._flush_settings_changed()
+
+        # Clear output and progress areas
+        self.clear_progress_areas()
 
         # Reset progress indicators
         self.overall_progress_bar.setValue(0)
@@ -2457,6 +3127,7 @@ class MediaEncoderGUI(QWidget):
             ffmpeg_exe=self.ffmpeg_exe,
             multi_pass=self.multi_pass_checkbox.isChecked()  # Add this line
         )
+        self.encoding_worker.mi_cache_db_path = self.db_path  # Enable the persistent probe cache
         self.encoding_worker.progress.connect(self.update_progress)  # Send progress to PROGRESS_AREA
         self.encoding_worker.handbrake_output.connect(self.update_output)
         self.encoding_worker.overall_progress.connect(self.overall_progress_bar.setValue)  # Direct connection
@@ -2464,10 +3135,13 @@ class MediaEncoderGUI(QWidget):
         self.encoding_worker.current_file_progress.connect(self.current_file_progress_bar.setValue)  # Update current file progress bar
         self.encoding_worker.finished.connect(self.encoding_finished)
         self.encoding_worker.clear_progress.connect(self.clear_progress_areas)  # Connect the new signal
-        self.encoding_worker.delete_file_signal.connect(self.handle_delete_source_file)  # Connect the new signal
-        self.encoding_worker.start()
+        self.encoding_worker.delete_batch_signal.connect(self.handle_delete_source_files)  # Connect the new signal
+        self.encode_pool.start(self.encoding_worker)
 
     def clear_progress_areas(self):
+        # Drop buffered lines too, or the next flush would resurrect them
+        self._progress_buf.clear()
+        self._output_buf.clear()
         self.progress_area.clear()
         self.output_area.clear()
 
@@ -2481,6 +3155,11 @@ class MediaEncoderGUI(QWidget):
         # Reset the tooltip
         self.start_encoding_btn.setToolTip("")
 
+    def handle_delete_source_files(self, file_paths, delete_source_files_option):
+        # Handle a batch of source deletions emitted by the encoding worker
+        for file_path in file_paths:
+            self.handle_delete_source_file(file_path, delete_source_files_option)
+
     def handle_delete_source_file(self, file_path, delete_source_files_option):
         file_name = os.path.basename(file_path)
         option = delete_source_files_option.lower()  # Convert to lowercase
@@ -2512,19 +3191,43 @@ class MediaEncoderGUI(QWidget):
             self.update_progress(f"⚠️ Unrecognized delete source option '{delete_source_files_option}' for file: {file_name}")
 
     def update_progress(self, text):
-        # Append text to the progress area with proper formatting
-        self.progress_area.append(text)
-        # Scroll to the bottom to ensure the latest message is visible
-        self.progress_area.verticalScrollBar().setValue(self.progress_area.verticalScrollBar().maximum())
+        # Buffer the line; the flush timer appends the batch
+        self._progress_buf.append(text)
 
     def update_output(self, text):
-        self.output_area.append(text)
+        self._output_buf.append(text)
+
+    def _flush_stream_buffers(self):
+        # Append each pane's buffered lines in one call per tick
+        if self._progress_buf:
+            scrollbar = self.progress_area.verticalScrollBar()
+            at_bottom = scrollbar.value() >= scrollbar.maximum() - 4
+            self.progress_area.appendPlainText("\n".join(self._progress_buf))
+            self._progress_buf.clear()
+            if at_bottom:
+                # Keep following the tail unless the user scrolled up
+                scrollbar.setValue(scrollbar.maximum())
+        if self._output_buf:
+            self.output_area.appendPlainText("\n".join(self._output_buf))
+            self._output_buf.clear()
 
     def update_current_file_label(self, text):
         # Update the current file label
         self.current_file_label.setText(f"Current File: {text}")
 
     def on_settings_changed(self):
+        # Coalesce bursts of widget signals into one validation pass
+        self._settings_timer.start()
+
+    def _flush_settings_changed(self):
+        # Run a pending debounced validation pass now; actions that read
+        # target_size_mb/audio_bitrate must not see values from before an
+        # edit still sitting in the debounce window
+        if self._settings_timer.isActive():
+            self._settings_timer.stop()
+            self._do_settings_changed()
+
+    def _do_settings_changed(self):
         self.target_size_mb = self.target_size_input.text()
         self.audio_bitrate = self.audio_bitrate_input.text().strip() if self.audio_bitrate_input.text().strip() else None
         self.selected_preset = self.preset_combo.currentText()
@@ -2550,36 +3253,34 @@ class MediaEncoderGUI(QWidget):
             inputs_valid = False
             validation_errors.append("Invalid target size.")
 
-        # Validate destination folder
-        if not self.destination_folder or not os.path.isdir(self.destination_folder):
+        # Validate destination folder (stat only when the path changed)
+        if self.destination_folder != self._last_dest_path:
+            self._last_dest_ok = bool(self.destination_folder) and os.path.isdir(self.destination_folder)
+            self._last_dest_path = self.destination_folder
+        if not self._last_dest_ok:
             inputs_valid = False
             validation_errors.append("Invalid destination folder.")
 
         # If audio encoder is not 'copy' or 'None', require audio bitrate
-        if self.selected_audio_encoder not in ('copy', 'None'):
-            max_selected_audio_tracks = 0
-            for media in self.media_files:
-                num_selected_tracks = len(media.get('selected_audio_tracks', []))
-                max_selected_audio_tracks = max(max_selected_audio_tracks, num_selected_tracks)
+        if self.selected_audio_encoder not in _NO_AUDIO_BITRATE:
+            max_selected_audio_tracks = self._max_selected_audio_tracks
 
             if max_selected_audio_tracks > 0:
                 # Audio bitrate is required
                 if not self.audio_bitrate:
                     inputs_valid = False
                     validation_errors.append("Audio bitrate is required.")
+                elif not _BITRATES_RE.match(self.audio_bitrate):
+                    # One regex pass replaces the per-token isdigit/int loop
+                    inputs_valid = False
+                    validation_errors.append(f"Invalid audio bitrate value(s): {self.audio_bitrate}")
                 else:
-                    bitrate_values = [bitrate.strip() for bitrate in self.audio_bitrate.split(',')]
-                    if len(bitrate_values) != max_selected_audio_tracks:
+                    num_bitrate_values = self.audio_bitrate.count(',') + 1
+                    if num_bitrate_values != max_selected_audio_tracks:
                         inputs_valid = False
                         validation_errors.append(
-                            f"Number of audio bitrate values ({len(bitrate_values)}) does not match number of selected audio tracks ({max_selected_audio_tracks})."
+                            f"Number of audio bitrate values ({num_bitrate_values}) does not match number of selected audio tracks ({max_selected_audio_tracks})."
                         )
-                    else:
-                        for bitrate in bitrate_values:
-                            if not bitrate.isdigit() or int(bitrate) <= 0:
-                                inputs_valid = False
-                                validation_errors.append(f"Invalid audio bitrate value: {bitrate}")
-                                break
             else:
                 # No audio tracks selected, bitrate is not required
                 pass
@@ -2617,21 +3318,24 @@ class MediaEncoderGUI(QWidget):
     def delete_selected_media(self):
         selected_items = self.media_list.selectedItems()
         for item in selected_items:
-            media_dict = item.media_dict
+            media_dict = item.data(0, Qt.UserRole)
             if media_dict in self.media_files:
                 self.media_files.remove(media_dict)
             index = self.media_list.indexOfTopLevelItem(item)
             self.media_list.takeTopLevelItem(index)
+        self._last_recalc_hash = None  # The selection's composition changed
+        self._recompute_max_selected_tracks()
         self.on_settings_changed()  # Update button states if necessary
 
     def clear_media_list(self):
         # Clear media list and media_files
         self.media_list.clear()
         self.media_files = []
+        self._max_selected_audio_tracks = 0
+        self._last_recalc_hash = None
 
         # Clear progress area and output area
-        self.progress_area.clear()
-        self.output_area.clear()
+        self.clear_progress_areas()
 
         # Reset progress bars
         self.overall_progress_bar.setValue(0)
@@ -2645,35 +3349,25 @@ class MediaEncoderGUI(QWidget):
         self.on_settings_changed()  # Update button states if necessary
 
     def closeEvent(self, event):
-        # Save window size
+        # Persist window geometry and the current selections in one transaction
         window_size = self.size()
-        self.save_setting('window_width', str(window_size.width()))
-        self.save_setting('window_height', str(window_size.height()))
-
-        # Save window position
         window_pos = self.pos()
-        self.save_setting('window_x', str(window_pos.x()))
-        self.save_setting('window_y', str(window_pos.y()))
-
-        # Save splitter sizes
-        splitter_sizes = self.splitter.sizes()
-        self.save_setting('splitter_sizes', json.dumps(splitter_sizes))
-
-        # Save delete source files setting
-        delete_source_value = self.delete_source_combo.currentText()
-        self.save_setting('delete_source_files', delete_source_value)
-
-        # Save selected process priority
-        self.save_setting('selected_priority', self.priority_combo.currentText())
-
-        # Save selected encoder
-        self.save_setting('selected_encoder', self.selected_encoder)
-
-        # Save selected audio encoder
-        self.save_setting('selected_audio_encoder', self.selected_audio_encoder)
-
-        # Save selected preset
-        self.save_setting('selected_preset', self.preset_combo.currentText())
+        self.save_settings_bulk({
+            'window_width': str(window_size.width()),
+            'window_height': str(window_size.height()),
+            'window_x': str(window_pos.x()),
+            'window_y': str(window_pos.y()),
+            'splitter_sizes': json.dumps(self.splitter.sizes()),
+            'delete_source_files': self.delete_source_combo.currentText(),
+            'selected_priority': self.priority_combo.currentText(),
+            'selected_encoder': self.selected_encoder,
+            'selected_audio_encoder': self.selected_audio_encoder,
+            'selected_preset': self.preset_combo.currentText(),
+        })
+
+        # Flush any column widths still waiting on the debounce timer
+        self._width_flush_timer.stop()
+        self._flush_column_widths()
 
         # Close the database connection when the application is closed
         if hasattr(self, 'conn'):
@@ -2691,53 +3385,67 @@ class MediaEncoderGUI(QWidget):
             return
 
         # Collect the maximum number of audio tracks among selected items
-        max_audio_tracks = 0
-        for item in items:
-            media_dict = item.media_dict
-            audio_tracks = media_dict['info'].get('audio_tracks', [])
-            if len(audio_tracks) > max_audio_tracks:
-                max_audio_tracks = len(audio_tracks)
+        max_audio_tracks = max(
+            (len(item.data(0, Qt.UserRole)['info'].audio_tracks) for item in items),
+            default=0)
 
         if max_audio_tracks == 0:
             QMessageBox.information(self, "No Audio Tracks", "No audio tracks found in the selected media files.")
             return
 
-        # Create track labels
-        track_labels = [f"Track {i+1}" for i in range(max_audio_tracks)]
+        # Slice the shared label pool; fall back to building labels for the
+        # (unlikely) file with more tracks than the pool covers
+        if max_audio_tracks <= len(self._TRACK_LABELS):
+            track_labels = list(self._TRACK_LABELS[:max_audio_tracks])
+        else:
+            track_labels = [f"Track {i+1}" for i in range(max_audio_tracks)]
 
         dialog = AudioSelectionDialog(track_labels, parent=self)
 
         # Show the dialog
         if dialog.exec_() == QDialog.Accepted:
-            selected_tracks = dialog.get_selected_tracks()
-            # Apply selected tracks to all selected items
-            for item in items:
-                media_dict = item.media_dict
-                audio_tracks = media_dict['info'].get('audio_tracks', [])
-                # Adjust selected tracks to available tracks in this media
-                available_tracks = len(audio_tracks)
-                adjusted_selected_tracks = [idx for idx in selected_tracks if idx < available_tracks]
-                media_dict['selected_audio_tracks'] = adjusted_selected_tracks
-
-                # Update the display
-                # Build audio info based on selected tracks
-                selected_audio_info = []
-                for idx in adjusted_selected_tracks:
-                    track = audio_tracks[idx]
-                    bitrate = track.get('BitRate')
-                    bitrate_display = "Unknown Bitrate"
-                    if bitrate and isinstance(bitrate, (int, float, str)) and str(bitrate).lower() != "n/a":
-                        try:
-                            bitrate_float = float(bitrate)
-                            bitrate_kbps = int(bitrate_float / 1000) if bitrate_float else 0
-                            bitrate_display = f"{bitrate_kbps} kbps" if bitrate_kbps > 0 else "Unknown Bitrate"
-                        except ValueError:
-                            pass  # Keep as "Unknown Bitrate" if conversion fails
-                    format_str = track.get('Format', 'Unknown')
-                    audio_info = f"{idx+1}: {format_str} {bitrate_display}"
-                    selected_audio_info.append(audio_info)
-                media_dict['info']['audio'] = "\n".join(selected_audio_info) if selected_audio_info else "No Audio Tracks Selected"
-                item.setText(COL_AUDIO, media_dict['info']['audio'])
+            selected_tracks = sorted(dialog.get_selected_tracks())
+            # Apply selected tracks to all selected items, with repaints and
+            # itemChanged signals suspended so Qt coalesces the row updates
+            # into a single relayout instead of one per setText
+            any_changed = False
+            self.media_list.setUpdatesEnabled(False)
+            self.media_list.blockSignals(True)
+            try:
+                for item in items:
+                    media_dict = item.data(0, Qt.UserRole)
+                    audio_tracks = media_dict['info'].audio_tracks
+                    # Adjust selected tracks to available tracks in this
+                    # media: selected_tracks is sorted, so a bisect slice
+                    # replaces the per-item linear filter
+                    available_tracks = len(audio_tracks)
+                    cut = bisect.bisect_left(selected_tracks, available_tracks)
+                    adjusted_selected_tracks = selected_tracks[:cut]
+                    # Confirming the dialog without changing this item's
+                    # selection leaves its row and media dict untouched
+                    if media_dict.get('selected_audio_tracks') == adjusted_selected_tracks:
+                        continue
+                    any_changed = True
+                    media_dict['selected_audio_tracks'] = adjusted_selected_tracks
+
+                    # Update the display from the track summaries precomputed
+                    # at probe time, joined in one pass with no intermediate
+                    # list; an empty join falls through to the placeholder
+                    media_dict['info'].audio = "\n".join(
+                        f"{idx+1}: {audio_tracks[idx]['_display']}"
+                        for idx in adjusted_selected_tracks
+                    ) or "No Audio Tracks Selected"
+                    item.setText(COL_AUDIO, media_dict['info'].audio)
+                    item.setToolTip(COL_AUDIO, media_dict['info'].audio)
+            finally:
+                self.media_list.blockSignals(False)
+                self.media_list.setUpdatesEnabled(True)
+
+            if not any_changed:
+                return
+
+            # Track-selection edits change the validation maximum
+            self._recompute_max_selected_tracks()
 
             # Update the info panel
             self.update_info_panel()
@@ -2746,7 +3454,33 @@ class MediaEncoderGUI(QWidget):
             self.on_settings_changed()
 
 if __name__ == '__main__':
+    if sys.platform.startswith('win'):
+        # Demote the GUI process itself so the encoder subprocesses win the
+        # scheduler; priority on the encoders alone is not enough on Windows
+        try:
+            import psutil
+            psutil.Process().nice(psutil.BELOW_NORMAL_PRIORITY_CLASS)
+        except ImportError:
+            pass
+
+    # Coalesce bursts of high-frequency events (paints, item updates) during
+    # bulk probing and encoding instead of waking the event loop per update,
+    # and use crisp pixmaps on high-DPI displays; both must be set before
+    # the QApplication is constructed
+    QApplication.setAttribute(Qt.AA_CompressHighFrequencyEvents, True)
+    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+
     app = QApplication(sys.argv)
+    # Style Qt's native tooltips like the old custom tooltip labels
+    app.setStyleSheet("""
+        QToolTip {
+            background-color: #FFFFFF;  /* White Background */
+            color: #000000;             /* Black Text */
+            border: 1px solid #A0A0A0;  /* Gray Border */
+            padding: 5px;
+            font-size: 9pt;             /* Increased Font Size */
+        }
+    """)
     gui = MediaEncoderGUI()
     gui.show()
     sys.exit(app.exec_())